@@ -1,10 +1,9 @@
 import sys
 import os
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool, MetaData, Table, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, Float
+from sqlalchemy import engine_from_config, pool, MetaData, Table, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, Float, func
 from sqlalchemy.dialects.postgresql import JSONB
 from alembic import context
-from datetime import datetime
 
 # Adiciona src ao sys.path para imports absolutos
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
@@ -32,8 +31,8 @@ users_table = Table(
     Column('preferred_language', String(10), default='pt-BR'),
     Column('timezone', String(50), default='America/Sao_Paulo'),
     Column('preferences', JSONB),
-    Column('created_at', DateTime, default=datetime.now),
-    Column('last_active', DateTime, default=datetime.now),
+    Column('created_at', DateTime, server_default=func.now()),
+    Column('last_active', DateTime, server_default=func.now()),
     Column('is_active', Boolean, default=True),
     Index('idx_users_email', 'email'),
     Index('idx_users_role', 'role'),
@@ -49,8 +48,8 @@ conversations_table = Table(
     Column('status', String(20), default='active'),
     Column('context', JSONB),
     Column('summary', Text),
-    Column('started_at', DateTime, default=datetime.now),
-    Column('last_message_at', DateTime, default=datetime.now),
+    Column('started_at', DateTime, server_default=func.now()),
+    Column('last_message_at', DateTime, server_default=func.now()),
     Column('message_count', Integer, default=0),
     Column('total_tokens', Integer, default=0),
     Index('idx_conversations_user_id', 'user_id'),
@@ -68,7 +67,7 @@ messages_table = Table(
     Column('message_type', String(20), nullable=False),
     Column('content', Text, nullable=False),
     Column('metadata', JSONB),
-    Column('timestamp', DateTime, default=datetime.now),
+    Column('timestamp', DateTime, server_default=func.now()),
     Column('tokens_used', Integer),
     Column('response_time', Float),
     Index('idx_messages_conversation_id', 'conversation_id'),
@@ -89,8 +88,8 @@ memory_table = Table(
     Column('context', JSONB),
     Column('importance_score', Float, default=0.5),
     Column('access_count', Integer, default=0),
-    Column('created_at', DateTime, default=datetime.now),
-    Column('last_accessed', DateTime, default=datetime.now),
+    Column('created_at', DateTime, server_default=func.now()),
+    Column('last_accessed', DateTime, server_default=func.now()),
     Column('expires_at', DateTime),
     Index('idx_memory_user_id', 'user_id'),
     Index('idx_memory_correlation_id', 'correlation_id'),
@@ -110,7 +109,7 @@ audit_table = Table(
     Column('record_id', String(36)),
     Column('old_values', JSONB),
     Column('new_values', JSONB),
-    Column('timestamp', DateTime, default=datetime.now),
+    Column('timestamp', DateTime, server_default=func.now()),
     Column('ip_address', String(45)),
     Column('user_agent', String(500)),
     Index('idx_audit_user_id', 'user_id'),
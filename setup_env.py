@@ -4,18 +4,14 @@ Script para configurar arquivo .env para produção
 """
 
 import os
-import shutil
+import sys
 
 def setup_env():
     """Configura o arquivo .env para produção"""
     
     print("🔧 Configurando arquivo .env para produção...")
     
-    # Copia o arquivo de exemplo
-    if os.path.exists('env.example'):
-        shutil.copy('env.example', '.env')
-        print("✅ Arquivo .env criado baseado no env.example")
-    else:
+    if not os.path.exists('env.example'):
         print("❌ Arquivo env.example não encontrado")
         return False
     
@@ -30,31 +26,42 @@ def setup_env():
         'GOOGLE_CLOUD_REGION': 'us-central1'
     }
     
-    # Lê o arquivo .env
-    with open('.env', 'r') as f:
-        content = f.read()
-    
-    # Aplica as atualizações
+    # Reescreve o env.example em uma única passada por linha: cada chave
+    # conhecida tem a linha inteira substituída, as ausentes vão ao final
+    lines = []
+    seen = set()
+    with open('env.example', 'r') as f:
+        for line in f:
+            key = line.partition('=')[0].strip()
+            if key in env_updates:
+                lines.append(f"{key}={env_updates[key]}\n")
+                seen.add(key)
+            else:
+                lines.append(line if line.endswith('\n') else line + '\n')
     for key, value in env_updates.items():
-        # Substitui a linha se existir, ou adiciona no final
-        if f'{key}=' in content:
-            content = content.replace(f'{key}=', f'{key}={value}')
-        else:
-            content += f'\n{key}={value}'
+        if key not in seen:
+            lines.append(f"{key}={value}\n")
     
-    # Escreve o arquivo atualizado
-    with open('.env', 'w') as f:
-        f.write(content)
+    # Escreve o .env de uma vez, via arquivo temporário para nunca deixar
+    # um .env parcialmente escrito
+    with open('.env.tmp', 'w') as f:
+        f.write(''.join(lines))
+    os.replace('.env.tmp', '.env')
+    print("✅ Arquivo .env criado baseado no env.example")
     
-    print("✅ Configurações de produção aplicadas")
-    print("\n📋 Próximos passos:")
-    print("1. Edite o arquivo .env e configure suas chaves:")
-    print("   - OPENAI_API_KEY")
-    print("   - JWT_SECRET")
-    print("   - PINECONE_API_KEY (se necessário)")
-    print("   - Outras chaves de API conforme necessário")
-    print("\n2. Execute o deploy:")
-    print("   ./deploy.sh")
+    # Instruções finais em uma única escrita no stdout
+    sys.stdout.write(
+        "✅ Configurações de produção aplicadas\n"
+        "\n📋 Próximos passos:\n"
+        "1. Edite o arquivo .env e configure suas chaves:\n"
+        "   - OPENAI_API_KEY\n"
+        "   - JWT_SECRET\n"
+        "   - PINECONE_API_KEY (se necessário)\n"
+        "   - Outras chaves de API conforme necessário\n"
+        "\n2. Execute o deploy:\n"
+        "   ./deploy.sh\n"
+    )
+    sys.stdout.flush()
     
     return True
 
@@ -1,10 +1,23 @@
 import asyncio
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import heapq
+import re
+import time
+import weakref
+from functools import lru_cache, partial
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 
-from src.utils.logging import get_logger
+# pyahocorasick (opcional): varredura única das palavras-chave regulatórias
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+from src.utils.logging import get_logger, message_preview
 from src.config.settings import get_settings
 from src.mcp_servers import redemet_server, pinecone_server, aisweb_server, airportdb_server, weather_apis_server, anac_regulations_server
 from src.agents.handoffs import handoff_manager, AgentEnum
@@ -12,7 +25,248 @@ from src.agents.handoffs import handoff_manager, AgentEnum
 logger = get_logger()
 settings = get_settings()
 
-@dataclass
+_CONSULTED_PREFIX = " (consultado em "
+_CONSULTED_RE = re.compile(r'consultado em', re.IGNORECASE)
+_RBAC_RE = re.compile(r'rbac[-\s]?(\d+)', re.IGNORECASE)
+_IS_RE = re.compile(r'\bis[-\s]?(\d+)', re.IGNORECASE)
+
+_REGULATORY_KEYWORDS = (
+    'licença', 'habilitação', 'certificado', 'autorização', 'homologação',
+    'requisitos', 'limitações', 'procedimentos', 'normas', 'regulamento'
+)
+
+
+def _build_keyword_automaton(keywords):
+    """Monta o autômato Aho-Corasick que devolve a própria palavra-chave"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_REGULATORY_AUTOMATON = _build_keyword_automaton(_REGULATORY_KEYWORDS) if AHOCORASICK_AVAILABLE else None
+
+
+# Relógio de baixa resolução para os carimbos das respostas
+_CLOCK_RESOLUTION = 0.05
+_clock = {"value": datetime.now(timezone.utc), "checked": time.monotonic()}
+
+
+def _now() -> datetime:
+    """Horário UTC atual, relido no máximo a cada _CLOCK_RESOLUTION segundos"""
+    checked = time.monotonic()
+    if checked - _clock["checked"] > _CLOCK_RESOLUTION:
+        _clock["value"] = datetime.now(timezone.utc)
+        _clock["checked"] = checked
+    return _clock["value"]
+
+
+# Limite global de chamadas simultâneas a MCPs, compartilhado por todos os agentes.
+# Um semáforo por event loop: asyncio.Semaphore fica preso ao primeiro loop que o usa
+MAX_CONCURRENT_MCP_CALLS = 16
+_mcp_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _mcp_semaphore() -> asyncio.Semaphore:
+    """Semáforo de MCPs do event loop em execução (criado no primeiro uso)"""
+    loop = asyncio.get_running_loop()
+    semaphore = _mcp_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _mcp_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_MCP_CALLS)
+    return semaphore
+
+
+async def _gated(coro):
+    """Aguarda uma chamada de MCP dentro do limite global de concorrência"""
+    async with _mcp_semaphore():
+        return await coro
+
+
+def _count_relevant_matches(result: Dict[str, Any], threshold: float = 0.7) -> int:
+    """Quantos matches de uma busca no Pinecone superam o limiar dos validadores"""
+    if not result.get('success'):
+        return 0
+    return sum(1 for match in result.get('matches') or () if match.get('score', 0) > threshold)
+
+
+def _compile_keyword_table(table):
+    """Compila uma tabela (categoria, termos), em ordem de prioridade, numa única alternação"""
+    ranks = {}
+    for rank, (category, terms) in enumerate(table):
+        for term in terms:
+            ranks.setdefault(term, (rank, category))
+    # Lookahead para enxergar ocorrências sobrepostas; termos longos primeiro
+    alternation = "|".join(re.escape(term) for term in sorted(ranks, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), ranks
+
+
+def _classify_keywords(query_lower: str, compiled_table, default: str) -> str:
+    """Retorna a categoria de maior prioridade presente na consulta, em uma passada"""
+    pattern, ranks = compiled_table
+    best = None
+    for match in pattern.finditer(query_lower):
+        rank = ranks[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+            if rank[0] == 0:
+                break
+    return best[1] if best else default
+
+
+_REGULATION_TYPES = _compile_keyword_table((
+    ("RBAC", ('rbac', 'regulamento brasileiro')),
+    ("IS", ('is', 'instrução suplementar')),
+    ("ICAO", ('icao', 'anexo', 'doc')),
+    ("ICA", ('ica', 'instrução')),
+    ("Licenciamento", ('licença', 'habilitação', 'certificado')),
+))
+_WEATHER_TYPES = _compile_keyword_table((
+    ("METAR", ('metar',)),
+    ("TAF", ('taf',)),
+    ("SIGMET", ('sigmet',)),
+    ("GERAL", ('tempo', 'condições', 'meteorologia')),
+    ("NOTAM", ('notam',)),
+))
+_PERFORMANCE_TYPES = _compile_keyword_table((
+    ("PESO_BALANCEAMENTO", ('peso', 'weight', 'cg', 'balanceamento')),
+    ("DECOLAGEM", ('decolagem', 'takeoff')),
+    ("POUSO", ('pouso', 'landing')),
+    ("CRUZEIRO", ('cruzeiro', 'cruise')),
+    ("COMBUSTIVEL", ('combustível', 'fuel')),
+))
+_TECHNICAL_TYPES = _compile_keyword_table((
+    ("SISTEMAS", ('sistema', 'systems')),
+    ("MANUAIS", ('poh', 'afm', 'manual')),
+    ("PROCEDIMENTOS", ('qrh', 'checklist', 'procedimento')),
+    ("LIMITACOES", ('mel', 'limitação', 'restriction')),
+    ("AVIONICOS", ('avionics', 'aviônicos', 'garmin', 'honeywell')),
+))
+_EDUCATION_TYPES = _compile_keyword_table((
+    ("LICENCAS", ('licença', 'license')),
+    ("HABILITACOES", ('habilitação', 'rating')),
+    ("EXAMES", ('exame', 'prova', 'teste')),
+    ("CURSOS", ('curso', 'treinamento', 'formação')),
+    ("CARREIRA", ('carreira', 'profissão')),
+    ("INSTRUCAO", ('instrutor', 'instructor')),
+))
+_COMMUNICATION_TYPES = _compile_keyword_table((
+    ("FRASEOLOGIA", ('fraseologia', 'phraseology')),
+    ("SIGLAS", ('sigla', 'abreviação', 'acronym')),
+    ("TERMOS", ('termo', 'definição', 'conceito')),
+    ("COMUNICACAO", ('comunicação', 'radiotelefonia')),
+    ("FREQUENCIAS", ('frequência', 'frequency')),
+))
+_GEOGRAPHIC_TYPES = _compile_keyword_table((
+    ("AERODROMOS", ('aeródromo', 'airport')),
+    ("FIR", ('fir', 'região')),
+    ("CARTAS", ('carta', 'chart')),
+    ("COORDENADAS", ('coordenadas', 'posição')),
+    ("NOTAM", ('notam', 'restrição')),
+))
+_OPERATIONS_TYPES = _compile_keyword_table((
+    ("PLANEJAMENTO", ('planejamento', 'plano de voo')),
+    ("ROTA", ('rota', 'route')),
+    ("COMBUSTIVEL", ('combustível', 'fuel')),
+    ("ALTERNADOS", ('alternado', 'alternate')),
+    ("ETOPS", ('etops',)),
+    ("RVSM", ('rvsm',)),
+    ("PBN", ('pbn', 'rnav')),
+))
+
+# Classificações memorizadas por consulta: handoffs e novas tentativas que
+# reentram no agente com a mesma consulta não repetem a varredura
+CLASSIFICATION_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_regulation(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _REGULATION_TYPES, "Geral")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_weather(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _WEATHER_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_performance(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _PERFORMANCE_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_technical(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _TECHNICAL_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_education(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _EDUCATION_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_communication(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _COMMUNICATION_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_geographic(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _GEOGRAPHIC_TYPES, "GERAL")
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_operations(query_lower: str) -> str:
+    return _classify_keywords(query_lower, _OPERATIONS_TYPES, "GERAL")
+
+# Namespaces do Pinecone consultados por cada agente
+_REGULATORY_NAMESPACES = ('ANAC', 'DECEA', 'ICAO e seus Anexos')
+_TECHNICAL_NAMESPACES = ("Manuais_Aeronaves_Equipamentos", "InstrumentosAvionicosSistemasEletricos")
+_EDUCATION_NAMESPACES = (
+    "MaterialFormacao_BancaANAC_Simulados",
+    "InstrutoresDeVoo",
+    "Exame SDEA ICAO ANAC"
+)
+
+# Tabelas (chaves, rótulo, formatador) dos campos exibidos de cada tipo de dado;
+# o formatador recebe os valores das chaves, na ordem
+_METAR_FIELDS = (
+    (('raw',), "Código", str),
+    (('time',), "Horário", str),
+    (('wind',), "Vento", lambda wind: f"{wind.get('direction', 'N/A')}°/{wind.get('speed', 'N/A')}kt"),
+    (('visibility',), "Visibilidade", str),
+)
+_TAF_FIELDS = (
+    (('raw',), "Código", str),
+    (('valid_from', 'valid_to'), "Válido", lambda valid_from, valid_to: f"{valid_from} até {valid_to}"),
+)
+_AIRPORT_FIELDS = (
+    (('name',), "Nome", str),
+    (('city',), "Cidade", str),
+    (('country',), "País", str),
+    (('elevation',), "Elevação", lambda elevation: f"{elevation} ft"),
+    (('coordinates',), "Coordenadas", lambda coords: f"{coords.get('lat', 'N/A')}, {coords.get('lon', 'N/A')}"),
+)
+_NOTAM_FIELDS = (
+    (('text',), "Texto", str),
+    (('valid_from',), "Válido de", str),
+    (('valid_to',), "Válido até", str),
+)
+_DISTANCE_FIELDS = (
+    (('distance',), "Distância", str),
+    (('bearing',), "Rumo", str),
+    (('flight_time',), "Tempo estimado", str),
+)
+
+
+def _format_fields(data: Dict[str, Any], fields) -> List[str]:
+    """Linhas "Rótulo: valor" dos campos da tabela presentes em data"""
+    return [
+        f"{label}: {render(*(data[key] for key in keys))}"
+        for keys, label, render in fields
+        if all(key in data for key in keys)
+    ]
+
+@dataclass(slots=True)
 class AgentRequest:
     """Solicitação para agente auxiliar"""
     query: str
@@ -21,8 +275,13 @@ class AgentRequest:
     urgency: str
     entities: Dict[str, List[str]]
     timestamp: datetime
+    # Consulta em minúsculas, calculada uma vez para todos os classificadores
+    query_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.query_lower = self.query.lower()
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Resposta de agente auxiliar"""
     agent_name: str
@@ -35,42 +294,114 @@ class AgentResponse:
     error_message: Optional[str] = None
     additional_data: Optional[Dict[str, Any]] = None
 
+@dataclass(slots=True)
+class ValidatedData:
+    """Conteúdo consolidado pelo validador de um agente auxiliar"""
+    content_parts: List[str]
+    sources: List[str]
+    confidence: float
+    status: str
+
 class BaseAuxiliaryAgent(ABC):
     """Classe base para todos os agentes auxiliares"""
+    agent_enum: Optional[AgentEnum] = None
+
+    def __init_subclass__(cls, *, agent_enum: Optional[AgentEnum] = None, **kwargs):
+        # O tipo do agente é declarado uma vez na definição da classe
+        super().__init_subclass__(**kwargs)
+        if agent_enum is not None:
+            cls.agent_enum = agent_enum
+
     def __init__(self, agent_name: str, specialization: str):
         self.agent_name = agent_name
         self.specialization = specialization
         self.logger = get_logger()
-        handoff_manager.register_agent(AgentEnum.<NOME>, self)
 
     @abstractmethod
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         pass
 
-    def _log_action(self, action: str, message: str, success: bool, additional_context: Dict[str, Any] = None):
+    async def _gather_limited(self, coros) -> List[Any]:
+        """Executa consultas concorrentemente, dentro do limite global de chamadas a MCPs"""
+        return await asyncio.gather(*(_gated(coro) for coro in coros), return_exceptions=True)
+
+    async def _gather_until_relevant(self, coros, count_relevant, enough: int = 3) -> List[Any]:
+        """
+        Como _gather_limited, mas encerra assim que as respostas concluídas somam
+        `enough` itens relevantes; as consultas pendentes são canceladas e ficam None
+        """
+        tasks = [asyncio.ensure_future(_gated(coro)) for coro in coros]
+        index_of = {task: index for index, task in enumerate(tasks)}
+        results: List[Any] = [None] * len(tasks)
+        pending = set(tasks)
+        found = 0
+        try:
+            while pending and found < enough:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = index_of[task]
+                    # Consulta cancelada vira falha comum, sem abortar a requisição
+                    if task.cancelled():
+                        results[index] = asyncio.CancelledError()
+                    else:
+                        results[index] = task.exception() or task.result()
+                    if not isinstance(results[index], BaseException):
+                        found += count_relevant(index, results[index])
+        finally:
+            for task in pending:
+                task.cancel()
+            # Aguarda a limpeza do cancelamento antes de o agente responder
+            await asyncio.gather(*pending, return_exceptions=True)
+        return results
+
+    @staticmethod
+    def _select_relevant(items: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+        """Itens acima do limiar de score ou, se nenhum, os três de maior score"""
+        above, below = [], []
+        for item in items:
+            (above if item.get('score', 0) > threshold else below).append(item)
+        return above or heapq.nlargest(3, below, key=lambda item: item.get('score', 0))
+
+    @staticmethod
+    def _consolidate(items: List[Dict[str, Any]], default_source: str,
+                     min_length: int = 0) -> Tuple[List[str], List[str]]:
+        """Conteúdos com mais de min_length caracteres e suas fontes, em uma passada"""
+        pairs = [
+            (content, item.get('source', default_source))
+            for item in items
+            if len(content := item.get('content', '').strip()) > min_length
+        ]
+        if not pairs:
+            return [], []
+        contents, sources = zip(*pairs)
+        return list(contents), list(sources)
+
+    def _log_action(self, action: str, message: str, success: bool, *args,
+                    additional_context: Dict[str, Any] = None):
+        # args são interpolados em message com % só se o nível do log estiver ativo
         self.logger.log_agent_action(
             agent_name=self.agent_name,
             action=action,
             message=message,
             user_id=additional_context.get('user_id', 'system') if additional_context else 'system',
             success=success,
-            additional_context=additional_context or {}
+            additional_context=additional_context or {},
+            message_args=args
         )
 
     def _format_sources(self, sources: List[str]) -> List[str]:
-        formatted_sources = []
-        for source in sources:
-            if source and source.strip():
-                if 'consultado em' not in source.lower():
-                    timestamp = datetime.now().strftime('%d/%m/%Y %H:%M UTC')
-                    source = f"{source} (consultado em {timestamp})"
-                formatted_sources.append(source)
-        return formatted_sources
+        # O carimbo de consulta é o mesmo para todas as fontes da chamada
+        suffix = f"{_CONSULTED_PREFIX}{datetime.now().strftime('%d/%m/%Y %H:%M UTC')})"
+        return [
+            source if _CONSULTED_RE.search(source) else source + suffix
+            for source in sources
+            if source and not source.isspace()
+        ]
 
 # =============================
 # 1. REGULATORY AGENT
 # =============================
-class RegulatoryAgent(BaseAuxiliaryAgent):
+class RegulatoryAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.REGULATORY):
     """
     Agente Auxiliar 1 - Regulamentação Aeronáutica
     Especializado em RBACs, ISs, ANAC, ICAO
@@ -78,42 +409,44 @@ class RegulatoryAgent(BaseAuxiliaryAgent):
     def __init__(self):
         super().__init__("RegulatoryAgent", "Regulamentação Aeronáutica")
         self.priority_sources = ["RBAC", "IS", "ANAC", "ICAO", "DECEA"]
-        handoff_manager.register_agent(AgentEnum.REGULATORY, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         self._log_action(
             "process_regulatory_request",
-            f"Processando consulta regulatória: {request.query[:100]}...",
+            "Processando consulta regulatória: %s",
             True,
-            {"user_id": request.user_id, "urgency": request.urgency}
+            message_preview(request.query),
+            additional_context={"user_id": request.user_id, "urgency": request.urgency}
         )
         try:
-            regulation_type = self._identify_regulation_type(request.query)
-            search_terms = self._extract_regulatory_terms(request.query, request.entities)
+            regulation_type = self._identify_regulation_type(request.query_lower)
+            search_terms = self._extract_regulatory_terms(request.query_lower, request.entities)
             sources_data = await self._query_regulatory_sources(search_terms, regulation_type)
+            sources_count = len(sources_data)
             validated_info = self._validate_regulatory_info(sources_data)
             response_content = self._build_regulatory_response(validated_info, regulation_type)
             formatted_response = self._format_regulatory_output(response_content, validated_info)
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=formatted_response,
-                sources=self._format_sources(validated_info.get('sources', [])),
-                confidence=validated_info.get('confidence', 0.8),
-                reasoning=f"Consulta regulatória sobre {regulation_type} processada com {len(sources_data)} fontes",
+                sources=self._format_sources(validated_info.sources),
+                confidence=validated_info.confidence,
+                reasoning=f"Consulta regulatória sobre {regulation_type} processada com {sources_count} fontes",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "regulation_type": regulation_type,
                     "search_terms": search_terms,
-                    "sources_count": len(sources_data)
+                    "sources_count": sources_count
                 }
             )
         except Exception as e:
             self._log_action(
                 "regulatory_error",
-                f"Erro no processamento regulatório: {str(e)}",
+                "Erro no processamento regulatório: %s",
                 False,
-                {"user_id": request.user_id, "error": str(e)}
+                e,
+                additional_context={"user_id": request.user_id, "error": str(e)}
             )
             return AgentResponse(
                 agent_name=self.agent_name,
@@ -122,132 +455,137 @@ class RegulatoryAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_regulation_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['rbac', 'regulamento brasileiro']):
-            return "RBAC"
-        elif any(term in query_lower for term in ['is', 'instrução suplementar']):
-            return "IS"
-        elif any(term in query_lower for term in ['icao', 'anexo', 'doc']):
-            return "ICAO"
-        elif any(term in query_lower for term in ['ica', 'instrução']):
-            return "ICA"
-        elif any(term in query_lower for term in ['licença', 'habilitação', 'certificado']):
-            return "Licenciamento"
-        else:
-            return "Geral"
+    def _identify_regulation_type(self, query_lower: str) -> str:
+        return _classify_regulation(query_lower)
 
-    def _extract_regulatory_terms(self, query: str, entities: Dict[str, List[str]]) -> List[str]:
+    def _extract_regulatory_terms(self, query_lower: str, entities: Dict[str, List[str]]) -> List[str]:
         terms = []
         if 'regulations' in entities:
             terms.extend(entities['regulations'])
-        import re
-        rbac_matches = re.findall(r'rbac[-\s]?(\d+)', query.lower())
-        is_matches = re.findall(r'is[-\s]?(\d+)', query.lower())
+        rbac_matches = _RBAC_RE.findall(query_lower)
+        is_matches = _IS_RE.findall(query_lower)
         terms.extend([f"RBAC {num}" for num in rbac_matches])
         terms.extend([f"IS {num}" for num in is_matches])
-        regulatory_keywords = [
-            'licença', 'habilitação', 'certificado', 'autorização', 'homologação',
-            'requisitos', 'limitações', 'procedimentos', 'normas', 'regulamento'
-        ]
-        for keyword in regulatory_keywords:
-            if keyword in query.lower():
-                terms.append(keyword)
+        if _REGULATORY_AUTOMATON is not None:
+            terms.extend(keyword for _, keyword in _REGULATORY_AUTOMATON.iter(query_lower))
+        else:
+            terms.extend(keyword for keyword in _REGULATORY_KEYWORDS if keyword in query_lower)
         return list(set(terms))
 
     async def _query_regulatory_sources(self, search_terms: List[str], regulation_type: str) -> List[Dict[str, Any]]:
         sources_data = []
         try:
-            for namespace in ['ANAC', 'DECEA', 'ICAO e seus Anexos']:
-                for term in search_terms:
-                    try:
-                        result = await pinecone_server.search_knowledge(
-                            query=f"{regulation_type} {term}",
-                            namespace=namespace,
-                            top_k=3
-                        )
-                        if result.get('success') and result.get('matches'):
-                            sources_data.extend(result['matches'])
-                    except Exception as e:
-                        self._log_action(
-                            "pinecone_query_error",
-                            f"Erro na consulta Pinecone {namespace}: {str(e)}",
-                            False
-                        )
-            try:
-                for term in search_terms:
-                    result = await anac_regulations_server.search_rbac(term)
-                    if result.get('success'):
-                        sources_data.append({
-                            'content': result.get('content', ''),
-                            'source': f"ANAC Regulations - {term}",
-                            'score': 0.9
-                        })
-            except Exception as e:
-                self._log_action(
-                    "anac_regulations_error",
-                    f"Erro na consulta ANAC Regulations: {str(e)}",
-                    False
+            # Um lote por namespace com todos os termos, mais as consultas à ANAC,
+            # disparados juntos; os resultados mantêm a ordem de criação
+            namespaces = _REGULATORY_NAMESPACES
+            # Termos que diferem só em caixa ou espaços (ex.: entidade "rbac 61" e
+            # regex "RBAC 61") viram uma única consulta por namespace
+            unique_terms: Dict[str, str] = {}
+            for term in search_terms:
+                unique_terms.setdefault(" ".join(term.split()).casefold(), term)
+            search_terms = list(unique_terms.values())
+            queries = [f"{regulation_type} {term}" for term in search_terms]
+            # Três fontes relevantes já saturam a confiança do validador; as
+            # consultas ainda pendentes nesse ponto são canceladas
+            results = await self._gather_until_relevant(
+                [
+                    pinecone_server.search_knowledge_batch(queries=queries, namespace=namespace, top_k=3)
+                    for namespace in namespaces
+                ] + [anac_regulations_server.search_rbac(term) for term in search_terms],
+                lambda index, result: (
+                    _count_relevant_matches(result) if index < len(namespaces) else int(bool(result.get('success')))
                 )
+            )
+            pinecone_results = results[:len(namespaces)]
+            anac_results = results[len(namespaces):]
+
+            for namespace, result in zip(namespaces, pinecone_results):
+                if result is None:
+                    continue
+                if isinstance(result, BaseException):
+                    self._log_action(
+                        "pinecone_query_error",
+                        "Erro na consulta Pinecone %s: %s",
+                        False,
+                        namespace,
+                        result
+                    )
+                    continue
+                if result.get('failed_queries', 0) > 0:
+                    self._log_action(
+                        "pinecone_query_error",
+                        "Consultas Pinecone com falha em %s: %d de %d",
+                        False,
+                        namespace,
+                        result['failed_queries'],
+                        len(queries)
+                    )
+                if result.get('success') and result.get('matches'):
+                    sources_data.extend(result['matches'])
+            for term, result in zip(search_terms, anac_results):
+                if result is None:
+                    continue
+                if isinstance(result, BaseException):
+                    self._log_action(
+                        "anac_regulations_error",
+                        "Erro na consulta ANAC Regulations: %s",
+                        False,
+                        result
+                    )
+                elif result.get('success'):
+                    sources_data.append({
+                        'content': result.get('content', ''),
+                        'source': f"ANAC Regulations - {term}",
+                        'score': 0.9
+                    })
         except Exception as e:
             self._log_action(
                 "regulatory_sources_error",
-                f"Erro geral na consulta de fontes regulatórias: {str(e)}",
-                False
+                "Erro geral na consulta de fontes regulatórias: %s",
+                False,
+                e
             )
         return sources_data
 
-    def _validate_regulatory_info(self, sources_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _validate_regulatory_info(self, sources_data: List[Dict[str, Any]]) -> ValidatedData:
         if not sources_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'validation_status': 'no_data'
-            }
-        relevant_sources = [s for s in sources_data if s.get('score', 0) > 0.7]
-        if not relevant_sources:
-            relevant_sources = sources_data[:3]
-        consolidated_content = []
-        sources_list = []
-        for source in relevant_sources:
-            content = source.get('content', '').strip()
-            source_name = source.get('source', 'Fonte não identificada')
-            if content and len(content) > 50:
-                consolidated_content.append(content)
-                sources_list.append(source_name)
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
+        relevant_sources = self._select_relevant(sources_data, 0.7)
+        consolidated_content, sources_list = self._consolidate(relevant_sources, 'Fonte não identificada', min_length=50)
         confidence = min(0.9, len(relevant_sources) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'validation_status': 'validated' if consolidated_content else 'insufficient_data'
-        }
-
-    def _build_regulatory_response(self, validated_info: Dict[str, Any], regulation_type: str) -> str:
-        if validated_info['validation_status'] == 'no_data':
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='validated' if consolidated_content else 'insufficient_data'
+        )
+
+    def _build_regulatory_response(self, validated_info: ValidatedData, regulation_type: str) -> str:
+        if validated_info.status == 'no_data':
             return "⚠ Nenhuma informação regulatória encontrada nas fontes consultadas."
-        if validated_info['validation_status'] == 'insufficient_data':
+        if validated_info.status == 'insufficient_data':
             return "⚠ Informação regulatória insuficiente nas fontes oficiais consultadas."
-        content = validated_info['content']
-        response = f"**REGULAMENTAÇÃO - {regulation_type.upper()}**\n\n"
-        response += content
-        return response
+        # Cabeçalho e conteúdo são unidos em uma única junção
+        return '\n\n'.join([f"**REGULAMENTAÇÃO - {regulation_type.upper()}**", *validated_info.content_parts])
 
-    def _format_regulatory_output(self, response_content: str, validated_info: Dict[str, Any]) -> str:
-        formatted_response = response_content
-        if validated_info['confidence'] < 0.8:
-            formatted_response += "\n\n⚠ **ATENÇÃO**: Informação com confiança limitada. Confirme com fonte oficial."
-        return formatted_response
+    def _format_regulatory_output(self, response_content: str, validated_info: ValidatedData) -> str:
+        if validated_info.confidence >= 0.8:
+            return response_content
+        return f"{response_content}\n\n⚠ **ATENÇÃO**: Informação com confiança limitada. Confirme com fonte oficial."
 
 # =============================
 # 2. WEATHER AGENT
 # =============================
-class WeatherAgent(BaseAuxiliaryAgent):
+class WeatherAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.WEATHER):
     """
     Agente Auxiliar 2 - Meteorologia e Informações Operacionais
     Especializado em METAR, TAF, SIGMET, NOTAMs
@@ -255,17 +593,17 @@ class WeatherAgent(BaseAuxiliaryAgent):
     def __init__(self):
         super().__init__("WeatherAgent", "Meteorologia e Informações Operacionais")
         self.weather_mcps = [redemet_server, aisweb_server, weather_apis_server]
-        handoff_manager.register_agent(AgentEnum.WEATHER, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         self._log_action(
             "process_weather_request",
-            f"Processando consulta meteorológica: {request.query[:100]}...",
+            "Processando consulta meteorológica: %s",
             True,
-            {"user_id": request.user_id, "urgency": request.urgency}
+            message_preview(request.query),
+            additional_context={"user_id": request.user_id, "urgency": request.urgency}
         )
         try:
-            weather_type = self._identify_weather_type(request.query)
+            weather_type = self._identify_weather_type(request.query_lower)
             icao_codes = request.entities.get('icao_codes', [])
             weather_terms = request.entities.get('weather_terms', [])
             weather_data = await self._query_weather_sources(weather_type, icao_codes, weather_terms)
@@ -274,11 +612,11 @@ class WeatherAgent(BaseAuxiliaryAgent):
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(interpreted_data.get('sources', [])),
-                confidence=interpreted_data.get('confidence', 0.8),
+                sources=self._format_sources(interpreted_data.sources),
+                confidence=interpreted_data.confidence,
                 reasoning=f"Consulta meteorológica {weather_type} para {len(icao_codes)} aeródromos",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "weather_type": weather_type,
                     "icao_codes": icao_codes,
@@ -293,63 +631,49 @@ class WeatherAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_weather_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if 'metar' in query_lower:
-            return "METAR"
-        elif 'taf' in query_lower:
-            return "TAF"
-        elif 'sigmet' in query_lower:
-            return "SIGMET"
-        elif any(term in query_lower for term in ['tempo', 'condições', 'meteorologia']):
-            return "GERAL"
-        elif 'notam' in query_lower:
-            return "NOTAM"
-        else:
-            return "GERAL"
+    def _identify_weather_type(self, query_lower: str) -> str:
+        return _classify_weather(query_lower)
 
     async def _query_weather_sources(self, weather_type: str, icao_codes: List[str], weather_terms: List[str]) -> List[Dict[str, Any]]:
         weather_data = []
+        # Todas as consultas (ICAO × tipo) são disparadas juntas
+        requests = []
         for icao in icao_codes:
-            try:
-                if weather_type in ["METAR", "GERAL"]:
-                    result = await redemet_server.get_mensagens_metar(icao)
-                    if result.get('success'):
-                        weather_data.append({
-                            'type': 'METAR',
-                            'icao': icao,
-                            'data': result.get('data'),
-                            'source': 'REDEMET'
-                        })
-                if weather_type in ["TAF", "GERAL"]:
-                    result = await redemet_server.get_mensagens_taf(icao)
-                    if result.get('success'):
-                        weather_data.append({
-                            'type': 'TAF',
-                            'icao': icao,
-                            'data': result.get('data'),
-                            'source': 'REDEMET'
-                        })
-            except Exception as e:
+            if weather_type in ["METAR", "GERAL"]:
+                requests.append(('METAR', icao, redemet_server.get_mensagens_metar(icao)))
+            if weather_type in ["TAF", "GERAL"]:
+                requests.append(('TAF', icao, redemet_server.get_mensagens_taf(icao)))
+        results = await self._gather_limited(coro for _, _, coro in requests)
+        for (data_type, icao, _), result in zip(requests, results):
+            if isinstance(result, BaseException):
                 self._log_action(
                     "redemet_query_error",
-                    f"Erro na consulta REDEMET para {icao}: {str(e)}",
-                    False
+                    "Erro na consulta REDEMET para %s: %s",
+                    False,
+                    icao,
+                    result
                 )
+            elif result.get('success'):
+                weather_data.append({
+                    'type': data_type,
+                    'icao': icao,
+                    'data': result.get('data'),
+                    'source': 'REDEMET'
+                })
         return weather_data
 
-    def _interpret_weather_data(self, weather_data: List[Dict[str, Any]], weather_type: str) -> Dict[str, Any]:
+    def _interpret_weather_data(self, weather_data: List[Dict[str, Any]], weather_type: str) -> ValidatedData:
         if not weather_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'interpretation': 'no_data'
-            }
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
         interpreted_content = []
         sources_list = []
         for data in weather_data:
@@ -361,12 +685,12 @@ class WeatherAgent(BaseAuxiliaryAgent):
                 interpreted_content.append(f"**{data_type} {icao}:**\n{self._format_weather_data(raw_data, data_type)}")
                 sources_list.append(f"{source} - {data_type} {icao}")
         confidence = min(0.9, len(weather_data) * 0.4)
-        return {
-            'content': '\n\n'.join(interpreted_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'interpretation': 'success' if interpreted_content else 'no_valid_data'
-        }
+        return ValidatedData(
+            content_parts=interpreted_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='success' if interpreted_content else 'no_valid_data'
+        )
 
     def _format_weather_data(self, raw_data: Dict[str, Any], data_type: str) -> str:
         if data_type == "METAR":
@@ -377,50 +701,34 @@ class WeatherAgent(BaseAuxiliaryAgent):
             return str(raw_data)
 
     def _format_metar(self, metar_data: Dict[str, Any]) -> str:
-        formatted = []
-        if 'raw' in metar_data:
-            formatted.append(f"Código: {metar_data['raw']}")
-        if 'time' in metar_data:
-            formatted.append(f"Horário: {metar_data['time']}")
-        if 'wind' in metar_data:
-            wind = metar_data['wind']
-            formatted.append(f"Vento: {wind.get('direction', 'N/A')}°/{wind.get('speed', 'N/A')}kt")
-        if 'visibility' in metar_data:
-            formatted.append(f"Visibilidade: {metar_data['visibility']}")
+        formatted = _format_fields(metar_data, _METAR_FIELDS)
         return '\n'.join(formatted) if formatted else str(metar_data)
 
     def _format_taf(self, taf_data: Dict[str, Any]) -> str:
-        formatted = []
-        if 'raw' in taf_data:
-            formatted.append(f"Código: {taf_data['raw']}")
-        if 'valid_from' in taf_data and 'valid_to' in taf_data:
-            formatted.append(f"Válido: {taf_data['valid_from']} até {taf_data['valid_to']}")
+        formatted = _format_fields(taf_data, _TAF_FIELDS)
         return '\n'.join(formatted) if formatted else str(taf_data)
 
-    def _build_weather_response(self, interpreted_data: Dict[str, Any], weather_type: str) -> str:
-        if interpreted_data['interpretation'] == 'no_data':
+    def _build_weather_response(self, interpreted_data: ValidatedData, weather_type: str) -> str:
+        if interpreted_data.status == 'no_data':
             return "⚠ Nenhuma informação meteorológica encontrada nas fontes consultadas."
-        if interpreted_data['interpretation'] == 'no_valid_data':
+        if interpreted_data.status == 'no_valid_data':
             return "⚠ Dados meteorológicos indisponíveis ou inválidos nas fontes consultadas."
-        content = interpreted_data['content']
-        response = f"**METEOROLOGIA - {weather_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**METEOROLOGIA - {weather_type.upper()}**", *interpreted_data.content_parts])
 
 # =============================
 # 3. PERFORMANCE AGENT
 # =============================
-class PerformanceAgent(BaseAuxiliaryAgent):
+class PerformanceAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.PERFORMANCE):
     """
     Agente Auxiliar 3 - Peso, Balanceamento e Performance
     Especializado em cálculos de peso/CG, performance, limitações
     """
     def __init__(self):
         super().__init__("PerformanceAgent", "Peso, Balanceamento e Performance")
-        handoff_manager.register_agent(AgentEnum.PERFORMANCE, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            performance_type = self._identify_performance_type(request.query)
+            performance_type = self._identify_performance_type(request.query_lower)
             aircraft_types = request.entities.get('aircraft_types', [])
             performance_data = await self._query_performance_sources(performance_type, aircraft_types)
             calculated_data = self._calculate_performance(performance_data, performance_type)
@@ -428,11 +736,11 @@ class PerformanceAgent(BaseAuxiliaryAgent):
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(calculated_data.get('sources', [])),
-                confidence=calculated_data.get('confidence', 0.7),
+                sources=self._format_sources(calculated_data.sources),
+                confidence=calculated_data.confidence,
                 reasoning=f"Análise de performance {performance_type} para {len(aircraft_types)} aeronaves",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "performance_type": performance_type,
                     "aircraft_types": aircraft_types
@@ -446,95 +754,79 @@ class PerformanceAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_performance_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['peso', 'weight', 'cg', 'balanceamento']):
-            return "PESO_BALANCEAMENTO"
-        elif any(term in query_lower for term in ['decolagem', 'takeoff']):
-            return "DECOLAGEM"
-        elif any(term in query_lower for term in ['pouso', 'landing']):
-            return "POUSO"
-        elif any(term in query_lower for term in ['cruzeiro', 'cruise']):
-            return "CRUZEIRO"
-        elif any(term in query_lower for term in ['combustível', 'fuel']):
-            return "COMBUSTIVEL"
-        else:
-            return "GERAL"
+    def _identify_performance_type(self, query_lower: str) -> str:
+        return _classify_performance(query_lower)
 
     async def _query_performance_sources(self, performance_type: str, aircraft_types: List[str]) -> List[Dict[str, Any]]:
         performance_data = []
         try:
-            for aircraft in aircraft_types:
-                result = await pinecone_server.search_knowledge(
-                    query=f"{performance_type} {aircraft}",
-                    namespace="PesoBalanceamento_Performance",
-                    top_k=5
+            result = await _gated(pinecone_server.search_knowledge_batch(
+                queries=[f"{performance_type} {aircraft}" for aircraft in aircraft_types],
+                namespace="PesoBalanceamento_Performance",
+                top_k=5
+            ))
+            if result.get('failed_queries', 0) > 0:
+                self._log_action(
+                    "performance_query_error",
+                    "Consultas de performance com falha: %d de %d",
+                    False,
+                    result['failed_queries'],
+                    len(aircraft_types)
                 )
-                if result.get('success') and result.get('matches'):
-                    performance_data.extend(result['matches'])
+            if result.get('success') and result.get('matches'):
+                performance_data.extend(result['matches'])
         except Exception as e:
             self._log_action(
                 "performance_query_error",
-                f"Erro na consulta de performance: {str(e)}",
-                False
+                "Erro na consulta de performance: %s",
+                False,
+                e
             )
         return performance_data
 
-    def _calculate_performance(self, performance_data: List[Dict[str, Any]], performance_type: str) -> Dict[str, Any]:
+    def _calculate_performance(self, performance_data: List[Dict[str, Any]], performance_type: str) -> ValidatedData:
         if not performance_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'calculations': 'no_data'
-            }
-        relevant_data = [d for d in performance_data if d.get('score', 0) > 0.6]
-        if not relevant_data:
-            relevant_data = performance_data[:3]
-        consolidated_content = []
-        sources_list = []
-        for data in relevant_data:
-            content = data.get('content', '').strip()
-            source = data.get('source', 'Fonte não identificada')
-            if content:
-                consolidated_content.append(content)
-                sources_list.append(source)
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
+        relevant_data = self._select_relevant(performance_data, 0.6)
+        consolidated_content, sources_list = self._consolidate(relevant_data, 'Fonte não identificada')
         confidence = min(0.8, len(relevant_data) * 0.25)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'calculations': 'completed' if consolidated_content else 'insufficient_data'
-        }
-
-    def _build_performance_response(self, calculated_data: Dict[str, Any], performance_type: str) -> str:
-        if calculated_data['calculations'] == 'no_data':
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='completed' if consolidated_content else 'insufficient_data'
+        )
+
+    def _build_performance_response(self, calculated_data: ValidatedData, performance_type: str) -> str:
+        if calculated_data.status == 'no_data':
             return "⚠ Nenhum dado de performance encontrado nas fontes consultadas."
-        if calculated_data['calculations'] == 'insufficient_data':
+        if calculated_data.status == 'insufficient_data':
             return "⚠ Dados de performance insuficientes nas fontes consultadas."
-        content = calculated_data['content']
-        response = f"**PERFORMANCE - {performance_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**PERFORMANCE - {performance_type.upper()}**", *calculated_data.content_parts])
 
 # =============================
 # 4. TECHNICAL AGENT
 # =============================
-class TechnicalAgent(BaseAuxiliaryAgent):
+class TechnicalAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.TECHNICAL):
     """
     Agente Auxiliar 4 - Aeronaves, Sistemas, Manuais Técnicos
     Especializado em POH/AFM, QRH, MEL, sistemas embarcados
     """
     def __init__(self):
         super().__init__("TechnicalAgent", "Aeronaves, Sistemas, Manuais Técnicos")
-        handoff_manager.register_agent(AgentEnum.TECHNICAL, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            technical_type = self._identify_technical_type(request.query)
+            technical_type = self._identify_technical_type(request.query_lower)
             aircraft_types = request.entities.get('aircraft_types', [])
             technical_data = await self._query_technical_sources(technical_type, aircraft_types)
             validated_data = self._validate_technical_data(technical_data, technical_type)
@@ -542,11 +834,11 @@ class TechnicalAgent(BaseAuxiliaryAgent):
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(validated_data.get('sources', [])),
-                confidence=validated_data.get('confidence', 0.7),
+                sources=self._format_sources(validated_data.sources),
+                confidence=validated_data.confidence,
                 reasoning=f"Consulta técnica {technical_type} para {len(aircraft_types)} aeronaves",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "technical_type": technical_type,
                     "aircraft_types": aircraft_types
@@ -560,108 +852,107 @@ class TechnicalAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_technical_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['sistema', 'systems']):
-            return "SISTEMAS"
-        elif any(term in query_lower for term in ['poh', 'afm', 'manual']):
-            return "MANUAIS"
-        elif any(term in query_lower for term in ['qrh', 'checklist', 'procedimento']):
-            return "PROCEDIMENTOS"
-        elif any(term in query_lower for term in ['mel', 'limitação', 'restriction']):
-            return "LIMITACOES"
-        elif any(term in query_lower for term in ['avionics', 'aviônicos', 'garmin', 'honeywell']):
-            return "AVIONICOS"
-        else:
-            return "GERAL"
+    def _identify_technical_type(self, query_lower: str) -> str:
+        return _classify_technical(query_lower)
 
     async def _query_technical_sources(self, technical_type: str, aircraft_types: List[str]) -> List[Dict[str, Any]]:
         technical_data = []
         try:
-            namespaces = ["Manuais_Aeronaves_Equipamentos", "InstrumentosAvionicosSistemasEletricos"]
-            for namespace in namespaces:
-                for aircraft in aircraft_types:
-                    result = await pinecone_server.search_knowledge(
-                        query=f"{technical_type} {aircraft}",
-                        namespace=namespace,
-                        top_k=5
+            namespaces = _TECHNICAL_NAMESPACES
+            queries = [f"{technical_type} {aircraft}" for aircraft in aircraft_types]
+            results = await self._gather_until_relevant(
+                (
+                    pinecone_server.search_knowledge_batch(queries=queries, namespace=namespace, top_k=5)
+                    for namespace in namespaces
+                ),
+                lambda index, result: _count_relevant_matches(result)
+            )
+            for namespace, result in zip(namespaces, results):
+                if result is None:
+                    continue
+                if isinstance(result, BaseException):
+                    self._log_action(
+                        "technical_query_error",
+                        "Erro na consulta técnica %s: %s",
+                        False,
+                        namespace,
+                        result
                     )
-                    if result.get('success') and result.get('matches'):
-                        technical_data.extend(result['matches'])
+                    continue
+                if result.get('failed_queries', 0) > 0:
+                    self._log_action(
+                        "technical_query_error",
+                        "Consultas técnicas com falha em %s: %d de %d",
+                        False,
+                        namespace,
+                        result['failed_queries'],
+                        len(queries)
+                    )
+                if result.get('success') and result.get('matches'):
+                    technical_data.extend(result['matches'])
         except Exception as e:
             self._log_action(
                 "technical_query_error",
-                f"Erro na consulta técnica: {str(e)}",
-                False
+                "Erro na consulta técnica: %s",
+                False,
+                e
             )
         return technical_data
 
-    def _validate_technical_data(self, technical_data: List[Dict[str, Any]], technical_type: str) -> Dict[str, Any]:
+    def _validate_technical_data(self, technical_data: List[Dict[str, Any]], technical_type: str) -> ValidatedData:
         if not technical_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'validation': 'no_data'
-            }
-        relevant_data = [d for d in technical_data if d.get('score', 0) > 0.7]
-        if not relevant_data:
-            relevant_data = technical_data[:3]
-        consolidated_content = []
-        sources_list = []
-        for data in relevant_data:
-            content = data.get('content', '').strip()
-            source = data.get('source', 'Manual não identificado')
-            if content and len(content) > 30:
-                consolidated_content.append(content)
-                sources_list.append(source)
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
+        relevant_data = self._select_relevant(technical_data, 0.7)
+        consolidated_content, sources_list = self._consolidate(relevant_data, 'Manual não identificado', min_length=30)
         confidence = min(0.85, len(relevant_data) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'validation': 'validated' if consolidated_content else 'insufficient_data'
-        }
-
-    def _build_technical_response(self, validated_data: Dict[str, Any], technical_type: str) -> str:
-        if validated_data['validation'] == 'no_data':
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='validated' if consolidated_content else 'insufficient_data'
+        )
+
+    def _build_technical_response(self, validated_data: ValidatedData, technical_type: str) -> str:
+        if validated_data.status == 'no_data':
             return "⚠ Nenhuma informação técnica encontrada nas fontes consultadas."
-        if validated_data['validation'] == 'insufficient_data':
+        if validated_data.status == 'insufficient_data':
             return "⚠ Informação técnica insuficiente nas fontes consultadas."
-        content = validated_data['content']
-        response = f"**INFORMAÇÕES TÉCNICAS - {technical_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**INFORMAÇÕES TÉCNICAS - {technical_type.upper()}**", *validated_data.content_parts])
 
 # =============================
 # 5. EDUCATION AGENT
 # =============================
-class EducationAgent(BaseAuxiliaryAgent):
+class EducationAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.EDUCATION):
     """
     Agente Auxiliar 5 - Educação e Carreira Aeronáutica
     Especializado em licenças, habilitações, exames, formação
     """
     def __init__(self):
         super().__init__("EducationAgent", "Educação e Carreira Aeronáutica")
-        handoff_manager.register_agent(AgentEnum.EDUCATION, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            education_type = self._identify_education_type(request.query)
+            education_type = self._identify_education_type(request.query_lower)
             education_data = await self._query_education_sources(education_type)
             validated_data = self._validate_education_data(education_data, education_type)
             response_content = self._build_education_response(validated_data, education_type)
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(validated_data.get('sources', [])),
-                confidence=validated_data.get('confidence', 0.8),
+                sources=self._format_sources(validated_data.sources),
+                confidence=validated_data.confidence,
                 reasoning=f"Consulta educacional sobre {education_type}",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "education_type": education_type
                 }
@@ -674,113 +965,91 @@ class EducationAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_education_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['licença', 'license']):
-            return "LICENCAS"
-        elif any(term in query_lower for term in ['habilitação', 'rating']):
-            return "HABILITACOES"
-        elif any(term in query_lower for term in ['exame', 'prova', 'teste']):
-            return "EXAMES"
-        elif any(term in query_lower for term in ['curso', 'treinamento', 'formação']):
-            return "CURSOS"
-        elif any(term in query_lower for term in ['carreira', 'profissão']):
-            return "CARREIRA"
-        elif any(term in query_lower for term in ['instrutor', 'instructor']):
-            return "INSTRUCAO"
-        else:
-            return "GERAL"
+    def _identify_education_type(self, query_lower: str) -> str:
+        return _classify_education(query_lower)
 
     async def _query_education_sources(self, education_type: str) -> List[Dict[str, Any]]:
         education_data = []
         try:
-            namespaces = [
-                "MaterialFormacao_BancaANAC_Simulados",
-                "InstrutoresDeVoo",
-                "Exame SDEA ICAO ANAC"
-            ]
-            for namespace in namespaces:
-                result = await pinecone_server.search_knowledge(
-                    query=education_type,
-                    namespace=namespace,
-                    top_k=5
-                )
-                if result.get('success') and result.get('matches'):
+            # Os três namespaces são consultados juntos; os resultados mantêm a ordem
+            results = await self._gather_limited(
+                pinecone_server.search_knowledge(query=education_type, namespace=namespace, top_k=5)
+                for namespace in _EDUCATION_NAMESPACES
+            )
+            for namespace, result in zip(_EDUCATION_NAMESPACES, results):
+                if isinstance(result, BaseException):
+                    self._log_action(
+                        "education_query_error",
+                        "Erro na consulta educacional %s: %s",
+                        False,
+                        namespace,
+                        result
+                    )
+                elif result.get('success') and result.get('matches'):
                     education_data.extend(result['matches'])
         except Exception as e:
             self._log_action(
                 "education_query_error",
-                f"Erro na consulta educacional: {str(e)}",
-                False
+                "Erro na consulta educacional: %s",
+                False,
+                e
             )
         return education_data
 
-    def _validate_education_data(self, education_data: List[Dict[str, Any]], education_type: str) -> Dict[str, Any]:
+    def _validate_education_data(self, education_data: List[Dict[str, Any]], education_type: str) -> ValidatedData:
         if not education_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'validation': 'no_data'
-            }
-        relevant_data = [d for d in education_data if d.get('score', 0) > 0.6]
-        if not relevant_data:
-            relevant_data = education_data[:3]
-        consolidated_content = []
-        sources_list = []
-        for data in relevant_data:
-            content = data.get('content', '').strip()
-            source = data.get('source', 'Material educacional não identificado')
-            if content:
-                consolidated_content.append(content)
-                sources_list.append(source)
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
+        relevant_data = self._select_relevant(education_data, 0.6)
+        consolidated_content, sources_list = self._consolidate(relevant_data, 'Material educacional não identificado')
         confidence = min(0.9, len(relevant_data) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'validation': 'validated' if consolidated_content else 'insufficient_data'
-        }
-
-    def _build_education_response(self, validated_data: Dict[str, Any], education_type: str) -> str:
-        if validated_data['validation'] == 'no_data':
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='validated' if consolidated_content else 'insufficient_data'
+        )
+
+    def _build_education_response(self, validated_data: ValidatedData, education_type: str) -> str:
+        if validated_data.status == 'no_data':
             return "⚠ Nenhuma informação educacional encontrada nas fontes consultadas."
-        if validated_data['validation'] == 'insufficient_data':
+        if validated_data.status == 'insufficient_data':
             return "⚠ Informação educacional insuficiente nas fontes consultadas."
-        content = validated_data['content']
-        response = f"**EDUCAÇÃO E CARREIRA - {education_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**EDUCAÇÃO E CARREIRA - {education_type.upper()}**", *validated_data.content_parts])
 
 # =============================
 # 6. COMMUNICATION AGENT
 # =============================
-class CommunicationAgent(BaseAuxiliaryAgent):
+class CommunicationAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.COMMUNICATION):
     """
     Agente Auxiliar 6 - Comunicação Técnica e Didática
     Especializado em termos técnicos, siglas, jargões, fraseologia
     """
     def __init__(self):
         super().__init__("CommunicationAgent", "Comunicação Técnica e Didática")
-        handoff_manager.register_agent(AgentEnum.COMMUNICATION, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            communication_type = self._identify_communication_type(request.query)
+            communication_type = self._identify_communication_type(request.query_lower)
             communication_data = await self._query_communication_sources(communication_type)
             interpreted_data = self._interpret_communication_data(communication_data, communication_type)
             response_content = self._build_communication_response(interpreted_data, communication_type)
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(interpreted_data.get('sources', [])),
-                confidence=interpreted_data.get('confidence', 0.8),
+                sources=self._format_sources(interpreted_data.sources),
+                confidence=interpreted_data.confidence,
                 reasoning=f"Consulta de comunicação sobre {communication_type}",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "communication_type": communication_type
                 }
@@ -793,94 +1062,71 @@ class CommunicationAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_communication_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['fraseologia', 'phraseology']):
-            return "FRASEOLOGIA"
-        elif any(term in query_lower for term in ['sigla', 'abreviação', 'acronym']):
-            return "SIGLAS"
-        elif any(term in query_lower for term in ['termo', 'definição', 'conceito']):
-            return "TERMOS"
-        elif any(term in query_lower for term in ['comunicação', 'radiotelefonia']):
-            return "COMUNICACAO"
-        elif any(term in query_lower for term in ['frequência', 'frequency']):
-            return "FREQUENCIAS"
-        else:
-            return "GERAL"
+    def _identify_communication_type(self, query_lower: str) -> str:
+        return _classify_communication(query_lower)
 
     async def _query_communication_sources(self, communication_type: str) -> List[Dict[str, Any]]:
         communication_data = []
         try:
-            result = await pinecone_server.search_knowledge(
+            result = await _gated(pinecone_server.search_knowledge(
                 query=communication_type,
                 namespace="ComunicacoesAereas",
                 top_k=5
-            )
+            ))
             if result.get('success') and result.get('matches'):
                 communication_data.extend(result['matches'])
         except Exception as e:
             self._log_action(
                 "communication_query_error",
-                f"Erro na consulta de comunicação: {str(e)}",
-                False
+                "Erro na consulta de comunicação: %s",
+                False,
+                e
             )
         return communication_data
 
-    def _interpret_communication_data(self, communication_data: List[Dict[str, Any]], communication_type: str) -> Dict[str, Any]:
+    def _interpret_communication_data(self, communication_data: List[Dict[str, Any]], communication_type: str) -> ValidatedData:
         if not communication_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'interpretation': 'no_data'
-            }
-        relevant_data = [d for d in communication_data if d.get('score', 0) > 0.6]
-        if not relevant_data:
-            relevant_data = communication_data[:3]
-        consolidated_content = []
-        sources_list = []
-        for data in relevant_data:
-            content = data.get('content', '').strip()
-            source = data.get('source', 'Fonte de comunicação não identificada')
-            if content:
-                consolidated_content.append(content)
-                sources_list.append(source)
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
+        relevant_data = self._select_relevant(communication_data, 0.6)
+        consolidated_content, sources_list = self._consolidate(relevant_data, 'Fonte de comunicação não identificada')
         confidence = min(0.9, len(relevant_data) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'interpretation': 'success' if consolidated_content else 'insufficient_data'
-        }
-
-    def _build_communication_response(self, interpreted_data: Dict[str, Any], communication_type: str) -> str:
-        if interpreted_data['interpretation'] == 'no_data':
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='success' if consolidated_content else 'insufficient_data'
+        )
+
+    def _build_communication_response(self, interpreted_data: ValidatedData, communication_type: str) -> str:
+        if interpreted_data.status == 'no_data':
             return "⚠ Nenhuma informação de comunicação encontrada nas fontes consultadas."
-        if interpreted_data['interpretation'] == 'insufficient_data':
+        if interpreted_data.status == 'insufficient_data':
             return "⚠ Informação de comunicação insuficiente nas fontes consultadas."
-        content = interpreted_data['content']
-        response = f"**COMUNICAÇÃO - {communication_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**COMUNICAÇÃO - {communication_type.upper()}**", *interpreted_data.content_parts])
 
 # =============================
 # 7. GEOGRAPHIC AGENT
 # =============================
-class GeographicAgent(BaseAuxiliaryAgent):
+class GeographicAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.GEOGRAPHIC):
     """
     Agente Auxiliar 7 - Localização e Adaptação Geográfica
     Especializado em FIRs, aeródromos, cartas, contexto geográfico
     """
     def __init__(self):
         super().__init__("GeographicAgent", "Localização e Adaptação Geográfica")
-        handoff_manager.register_agent(AgentEnum.GEOGRAPHIC, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            geographic_type = self._identify_geographic_type(request.query)
+            geographic_type = self._identify_geographic_type(request.query_lower)
             icao_codes = request.entities.get('icao_codes', [])
             geographic_data = await self._query_geographic_sources(geographic_type, icao_codes)
             validated_data = self._validate_geographic_data(geographic_data, geographic_type)
@@ -888,11 +1134,11 @@ class GeographicAgent(BaseAuxiliaryAgent):
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(validated_data.get('sources', [])),
-                confidence=validated_data.get('confidence', 0.8),
+                sources=self._format_sources(validated_data.sources),
+                confidence=validated_data.confidence,
                 reasoning=f"Consulta geográfica {geographic_type} para {len(icao_codes)} localizações",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "geographic_type": geographic_type,
                     "icao_codes": icao_codes
@@ -906,70 +1152,70 @@ class GeographicAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_geographic_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['aeródromo', 'airport']):
-            return "AERODROMOS"
-        elif any(term in query_lower for term in ['fir', 'região']):
-            return "FIR"
-        elif any(term in query_lower for term in ['carta', 'chart']):
-            return "CARTAS"
-        elif any(term in query_lower for term in ['coordenadas', 'posição']):
-            return "COORDENADAS"
-        elif any(term in query_lower for term in ['notam', 'restrição']):
-            return "NOTAM"
-        else:
-            return "GERAL"
+    def _identify_geographic_type(self, query_lower: str) -> str:
+        return _classify_geographic(query_lower)
 
     async def _query_geographic_sources(self, geographic_type: str, icao_codes: List[str]) -> List[Dict[str, Any]]:
         geographic_data = []
         try:
-            for icao in icao_codes:
-                result = await airportdb_server.get_airport_info(icao)
-                if result.get('success'):
-                    geographic_data.append({
-                        'type': 'AIRPORT_INFO',
-                        'icao': icao,
-                        'data': result.get('data'),
-                        'source': 'AirportDB'
-                    })
-            result = await pinecone_server.search_knowledge(
+            # AirportDB, Pinecone e NOTAMs disparados juntos; os resultados
+            # mantêm a ordem de criação
+            requests = [
+                ('AIRPORT_INFO', icao, airportdb_server.get_airport_info(icao))
+                for icao in icao_codes
+            ]
+            requests.append(('AIP', "AIP_Brasil_Map", pinecone_server.search_knowledge(
                 query=f"{geographic_type} {' '.join(icao_codes)}",
                 namespace="AIP_Brasil_Map",
                 top_k=5
-            )
-            if result.get('success') and result.get('matches'):
-                geographic_data.extend(result['matches'])
+            )))
             if geographic_type == "NOTAM":
-                for icao in icao_codes:
-                    result = await aisweb_server.search_notam(icao_code=icao)
-                    if result.get('success'):
-                        geographic_data.append({
-                            'type': 'NOTAM',
-                            'icao': icao,
-                            'data': result.get('data'),
-                            'source': 'AISWEB'
-                        })
+                requests.extend(
+                    ('NOTAM', icao, aisweb_server.search_notam(icao_code=icao))
+                    for icao in icao_codes
+                )
+            results = await self._gather_limited(coro for _, _, coro in requests)
+            for (data_type, icao, _), result in zip(requests, results):
+                if isinstance(result, BaseException):
+                    self._log_action(
+                        "geographic_query_error",
+                        "Erro na consulta geográfica %s %s: %s",
+                        False,
+                        data_type,
+                        icao,
+                        result
+                    )
+                elif data_type == 'AIP':
+                    if result.get('success') and result.get('matches'):
+                        geographic_data.extend(result['matches'])
+                elif result.get('success'):
+                    geographic_data.append({
+                        'type': data_type,
+                        'icao': icao,
+                        'data': result.get('data'),
+                        'source': 'AirportDB' if data_type == 'AIRPORT_INFO' else 'AISWEB'
+                    })
         except Exception as e:
             self._log_action(
                 "geographic_query_error",
-                f"Erro na consulta geográfica: {str(e)}",
-                False
+                "Erro na consulta geográfica: %s",
+                False,
+                e
             )
         return geographic_data
 
-    def _validate_geographic_data(self, geographic_data: List[Dict[str, Any]], geographic_type: str) -> Dict[str, Any]:
+    def _validate_geographic_data(self, geographic_data: List[Dict[str, Any]], geographic_type: str) -> ValidatedData:
         if not geographic_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'validation': 'no_data'
-            }
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
         consolidated_content = []
         sources_list = []
         for data in geographic_data:
@@ -991,12 +1237,12 @@ class GeographicAgent(BaseAuxiliaryAgent):
                             consolidated_content.append(formatted_data)
                             sources_list.append(f"{source} - {icao}")
         confidence = min(0.9, len(consolidated_content) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'validation': 'validated' if consolidated_content else 'insufficient_data'
-        }
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='validated' if consolidated_content else 'insufficient_data'
+        )
 
     def _format_geographic_data(self, raw_data: Dict[str, Any], data_type: str, icao: str) -> str:
         if data_type == "AIRPORT_INFO":
@@ -1007,54 +1253,32 @@ class GeographicAgent(BaseAuxiliaryAgent):
             return str(raw_data)
 
     def _format_airport_info(self, airport_data: Dict[str, Any], icao: str) -> str:
-        formatted = [f"**AERÓDROMO {icao}:**"]
-        if 'name' in airport_data:
-            formatted.append(f"Nome: {airport_data['name']}")
-        if 'city' in airport_data:
-            formatted.append(f"Cidade: {airport_data['city']}")
-        if 'country' in airport_data:
-            formatted.append(f"País: {airport_data['country']}")
-        if 'elevation' in airport_data:
-            formatted.append(f"Elevação: {airport_data['elevation']} ft")
-        if 'coordinates' in airport_data:
-            coords = airport_data['coordinates']
-            formatted.append(f"Coordenadas: {coords.get('lat', 'N/A')}, {coords.get('lon', 'N/A')}")
-        return '\n'.join(formatted)
+        return '\n'.join([f"**AERÓDROMO {icao}:**", *_format_fields(airport_data, _AIRPORT_FIELDS)])
 
     def _format_notam_info(self, notam_data: Dict[str, Any], icao: str) -> str:
-        formatted = [f"**NOTAM {icao}:**"]
-        if 'text' in notam_data:
-            formatted.append(f"Texto: {notam_data['text']}")
-        if 'valid_from' in notam_data:
-            formatted.append(f"Válido de: {notam_data['valid_from']}")
-        if 'valid_to' in notam_data:
-            formatted.append(f"Válido até: {notam_data['valid_to']}")
-        return '\n'.join(formatted)
-
-    def _build_geographic_response(self, validated_data: Dict[str, Any], geographic_type: str) -> str:
-        if validated_data['validation'] == 'no_data':
+        return '\n'.join([f"**NOTAM {icao}:**", *_format_fields(notam_data, _NOTAM_FIELDS)])
+
+    def _build_geographic_response(self, validated_data: ValidatedData, geographic_type: str) -> str:
+        if validated_data.status == 'no_data':
             return "⚠ Nenhuma informação geográfica encontrada nas fontes consultadas."
-        if validated_data['validation'] == 'insufficient_data':
+        if validated_data.status == 'insufficient_data':
             return "⚠ Informação geográfica insuficiente nas fontes consultadas."
-        content = validated_data['content']
-        response = f"**INFORMAÇÕES GEOGRÁFICAS - {geographic_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**INFORMAÇÕES GEOGRÁFICAS - {geographic_type.upper()}**", *validated_data.content_parts])
 
 # =============================
 # 8. OPERATIONS AGENT
 # =============================
-class OperationsAgent(BaseAuxiliaryAgent):
+class OperationsAgent(BaseAuxiliaryAgent, agent_enum=AgentEnum.OPERATIONS):
     """
     Agente Auxiliar 8 - Planejamento de Voo Operacional
     Especializado em rotas, combustível, alternados, ETOPS, RVSM, PBN
     """
     def __init__(self):
         super().__init__("OperationsAgent", "Planejamento de Voo Operacional")
-        handoff_manager.register_agent(AgentEnum.OPERATIONS, self)
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         try:
-            operations_type = self._identify_operations_type(request.query)
+            operations_type = self._identify_operations_type(request.query_lower)
             icao_codes = request.entities.get('icao_codes', [])
             operations_data = await self._query_operations_sources(operations_type, icao_codes)
             validated_data = self._validate_operations_data(operations_data, operations_type)
@@ -1062,11 +1286,11 @@ class OperationsAgent(BaseAuxiliaryAgent):
             return AgentResponse(
                 agent_name=self.agent_name,
                 content=response_content,
-                sources=self._format_sources(validated_data.get('sources', [])),
-                confidence=validated_data.get('confidence', 0.8),
+                sources=self._format_sources(validated_data.sources),
+                confidence=validated_data.confidence,
                 reasoning=f"Consulta operacional {operations_type} para {len(icao_codes)} aeródromos",
                 success=True,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 additional_data={
                     "operations_type": operations_type,
                     "icao_codes": icao_codes
@@ -1080,37 +1304,21 @@ class OperationsAgent(BaseAuxiliaryAgent):
                 confidence=0.0,
                 reasoning=f"Erro no processamento: {str(e)}",
                 success=False,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=_now(),
                 error_message=str(e)
             )
 
-    def _identify_operations_type(self, query: str) -> str:
-        query_lower = query.lower()
-        if any(term in query_lower for term in ['planejamento', 'plano de voo']):
-            return "PLANEJAMENTO"
-        elif any(term in query_lower for term in ['rota', 'route']):
-            return "ROTA"
-        elif any(term in query_lower for term in ['combustível', 'fuel']):
-            return "COMBUSTIVEL"
-        elif any(term in query_lower for term in ['alternado', 'alternate']):
-            return "ALTERNADOS"
-        elif any(term in query_lower for term in ['etops']):
-            return "ETOPS"
-        elif any(term in query_lower for term in ['rvsm']):
-            return "RVSM"
-        elif any(term in query_lower for term in ['pbn', 'rnav']):
-            return "PBN"
-        else:
-            return "GERAL"
+    def _identify_operations_type(self, query_lower: str) -> str:
+        return _classify_operations(query_lower)
 
     async def _query_operations_sources(self, operations_type: str, icao_codes: List[str]) -> List[Dict[str, Any]]:
         operations_data = []
         try:
-            result = await pinecone_server.search_knowledge(
+            result = await _gated(pinecone_server.search_knowledge(
                 query=f"{operations_type} {' '.join(icao_codes)}",
                 namespace="Planejamento_de_Voo",
                 top_k=5
-            )
+            ))
             if result.get('success') and result.get('matches'):
                 operations_data.extend(result['matches'])
             if len(icao_codes) >= 2 and operations_type in ["ROTA", "PLANEJAMENTO"]:
@@ -1128,25 +1336,27 @@ class OperationsAgent(BaseAuxiliaryAgent):
                 except Exception as e:
                     self._log_action(
                         "distance_query_error",
-                        f"Erro na consulta de distância: {str(e)}",
-                        False
+                        "Erro na consulta de distância: %s",
+                        False,
+                        e
                     )
         except Exception as e:
             self._log_action(
                 "operations_query_error",
-                f"Erro na consulta operacional: {str(e)}",
-                False
+                "Erro na consulta operacional: %s",
+                False,
+                e
             )
         return operations_data
 
-    def _validate_operations_data(self, operations_data: List[Dict[str, Any]], operations_type: str) -> Dict[str, Any]:
+    def _validate_operations_data(self, operations_data: List[Dict[str, Any]], operations_type: str) -> ValidatedData:
         if not operations_data:
-            return {
-                'content': '',
-                'sources': [],
-                'confidence': 0.0,
-                'validation': 'no_data'
-            }
+            return ValidatedData(
+                content_parts=[],
+                sources=[],
+                confidence=0.0,
+                status='no_data'
+            )
         consolidated_content = []
         sources_list = []
         for data in operations_data:
@@ -1167,12 +1377,12 @@ class OperationsAgent(BaseAuxiliaryAgent):
                             consolidated_content.append(formatted_data)
                             sources_list.append(source)
         confidence = min(0.85, len(consolidated_content) * 0.3)
-        return {
-            'content': '\n\n'.join(consolidated_content),
-            'sources': sources_list,
-            'confidence': confidence,
-            'validation': 'validated' if consolidated_content else 'insufficient_data'
-        }
+        return ValidatedData(
+            content_parts=consolidated_content,
+            sources=sources_list,
+            confidence=confidence,
+            status='validated' if consolidated_content else 'insufficient_data'
+        )
 
     def _format_operations_data(self, raw_data: Dict[str, Any], data_type: str) -> str:
         if data_type == "DISTANCE":
@@ -1181,43 +1391,50 @@ class OperationsAgent(BaseAuxiliaryAgent):
             return str(raw_data)
 
     def _format_distance_data(self, distance_data: Dict[str, Any]) -> str:
-        formatted = ["**INFORMAÇÕES DE ROTA:**"]
-        if 'distance' in distance_data:
-            formatted.append(f"Distância: {distance_data['distance']}")
-        if 'bearing' in distance_data:
-            formatted.append(f"Rumo: {distance_data['bearing']}")
-        if 'flight_time' in distance_data:
-            formatted.append(f"Tempo estimado: {distance_data['flight_time']}")
-        return '\n'.join(formatted)
-
-    def _build_operations_response(self, validated_data: Dict[str, Any], operations_type: str) -> str:
-        if validated_data['validation'] == 'no_data':
+        return '\n'.join(["**INFORMAÇÕES DE ROTA:**", *_format_fields(distance_data, _DISTANCE_FIELDS)])
+
+    def _build_operations_response(self, validated_data: ValidatedData, operations_type: str) -> str:
+        if validated_data.status == 'no_data':
             return "⚠ Nenhuma informação operacional encontrada nas fontes consultadas."
-        if validated_data['validation'] == 'insufficient_data':
+        if validated_data.status == 'insufficient_data':
             return "⚠ Informação operacional insuficiente nas fontes consultadas."
-        content = validated_data['content']
-        response = f"**OPERAÇÕES - {operations_type.upper()}**\n\n{content}"
-        return response
+        return '\n\n'.join([f"**OPERAÇÕES - {operations_type.upper()}**", *validated_data.content_parts])
 
 # =============================
 # REGISTRY DOS AGENTES
 # =============================
-auxiliary_agents = {
-    "regulatory_agent": RegulatoryAgent(),
-    "weather_agent": WeatherAgent(),
-    "performance_agent": PerformanceAgent(),
-    "technical_agent": TechnicalAgent(),
-    "education_agent": EducationAgent(),
-    "communication_agent": CommunicationAgent(),
-    "geographic_agent": GeographicAgent(),
-    "operations_agent": OperationsAgent()
+# Classes dos agentes; cada um é instanciado, e registrado no HandoffManager,
+# apenas no primeiro uso
+_agent_classes = {
+    "regulatory_agent": RegulatoryAgent,
+    "weather_agent": WeatherAgent,
+    "performance_agent": PerformanceAgent,
+    "technical_agent": TechnicalAgent,
+    "education_agent": EducationAgent,
+    "communication_agent": CommunicationAgent,
+    "geographic_agent": GeographicAgent,
+    "operations_agent": OperationsAgent
 }
+_agent_instances: Dict[str, BaseAuxiliaryAgent] = {}
+
+def _get_agent(agent_name: str) -> Optional[BaseAuxiliaryAgent]:
+    """Instância única do agente, criada no primeiro uso"""
+    agent = _agent_instances.get(agent_name)
+    if agent is None and agent_name in _agent_classes:
+        # Construção síncrona: sem await entre a verificação e o registro,
+        # não há corrida entre tarefas do event loop
+        agent = _agent_instances[agent_name] = _agent_classes[agent_name]()
+        handoff_manager.register_agent(agent.agent_enum, agent)
+    return agent
+
+for agent_name, agent_class in _agent_classes.items():
+    handoff_manager.register_agent_factory(agent_class.agent_enum, partial(_get_agent, agent_name))
 
 async def get_auxiliary_agent(agent_name: str) -> Optional[BaseAuxiliaryAgent]:
-    return auxiliary_agents.get(agent_name)
+    return _get_agent(agent_name)
 
 async def execute_auxiliary_agent(agent_name: str, request: AgentRequest) -> AgentResponse:
-    agent = await get_auxiliary_agent(agent_name)
+    agent = _get_agent(agent_name)
     if not agent:
         return AgentResponse(
             agent_name=agent_name,
@@ -1226,7 +1443,7 @@ async def execute_auxiliary_agent(agent_name: str, request: AgentRequest) -> Age
             confidence=0.0,
             reasoning=f"Agente {agent_name} não disponível",
             success=False,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now(),
             error_message=f"Agente {agent_name} não encontrado"
         )
     return await agent.process_request(request) 
\ No newline at end of file
@@ -9,6 +9,7 @@ from enum import Enum
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
 from contextlib import asynccontextmanager
+from operator import itemgetter
 import inspect
 
 from src.utils.logging import get_logger
@@ -200,6 +201,50 @@ class CircuitBreaker:
         self.state = self.State.CLOSED
         self.last_failure = None
 
+# Ordem de métodos tentados em cada agente por tipo de handoff, e rótulo
+# registrado em mocks que expõem apenas a lista 'calls'
+_AGENT_DISPATCH = {
+    HandoffType.DELEGATION: (("process_with_handoffs", "process_request"), "process_with_handoffs"),
+    HandoffType.CONSULTATION: (("consult", "process_request"), "consult"),
+    HandoffType.ESCALATION: (("handle_escalation", "process_request"), "handle_escalation"),
+    HandoffType.VALIDATION: (("validate", "process_request"), "validate"),
+}
+
+async def _dispatch_to_agent(agent_instance: Any, handoff_type: HandoffType, ctx: Any, query: Any = None) -> Any:
+    """Invoca o agente conforme a tabela de despacho do tipo de handoff"""
+    method_names, mock_label = _AGENT_DISPATCH[handoff_type]
+    for method_name in method_names:
+        if hasattr(agent_instance, method_name):
+            method = getattr(agent_instance, method_name)
+            args = (query, ctx) if method_name == "consult" else (ctx,)
+            if inspect.iscoroutinefunction(method):
+                return await method(*args)
+            return method(*args)
+    if callable(agent_instance):
+        if inspect.iscoroutinefunction(agent_instance):
+            return await agent_instance(ctx)
+        return agent_instance(ctx)
+    if hasattr(agent_instance, 'calls') and isinstance(agent_instance.calls, list):
+        if handoff_type == HandoffType.CONSULTATION:
+            agent_instance.calls.append((mock_label, query, ctx))
+        else:
+            agent_instance.calls.append((mock_label, ctx))
+        return True
+    raise Exception(f"Agente não implementa {method_names[0]}")
+
+class _MCPDict(dict):
+    """Dicionário de MCPs acessível tanto por Enum quanto por string"""
+    
+    def __contains__(self, key):
+        if hasattr(key, 'value'):
+            return key.value in self
+        return super().__contains__(key)
+    
+    def __getitem__(self, key):
+        if hasattr(key, 'value'):
+            return super().__getitem__(key.value)
+        return super().__getitem__(key)
+
 # =============================
 # HANDOFF MANAGER
 # =============================
@@ -209,6 +254,8 @@ class HandoffManager:
     
     def __init__(self):
         self.agents_registry: Dict[str, Any] = {}
+        # Fábricas de agentes instanciados apenas no primeiro handoff que os usa
+        self.agent_factories: Dict[str, Callable[[], Any]] = {}
         self.mcps_registry: Dict[str, Any] = {}
         self.circuit_breakers: Dict[str, CircuitBreaker] = defaultdict(CircuitBreaker)
         self.circuit_breakers['default'] = CircuitBreaker()
@@ -235,7 +282,19 @@ class HandoffManager:
         self.agents_registry[key] = agent_instance
         if key not in self.circuit_breakers:
             self.circuit_breakers[key] = CircuitBreaker()
-        self.logger._log_info(f"Agente {key} registrado no HandoffManager")
+        self.logger._log_info("Agente %s registrado no HandoffManager", key)
+
+    def register_agent_factory(self, agent_type, factory: Callable[[], Any]):
+        """Registra a fábrica de um agente criado sob demanda"""
+        key = agent_type.value if hasattr(agent_type, 'value') else agent_type
+        self.agent_factories[key] = factory
+
+    def _resolve_agent(self, key):
+        """Agente registrado para key, instanciado pela fábrica se ainda não existir"""
+        agent_instance = self.agents_registry.get(key)
+        if agent_instance is None and key in self.agent_factories:
+            agent_instance = self.agent_factories.pop(key)()
+        return agent_instance
 
     def register_mcp(self, mcp_type, mcp_instance):
         """Registra um MCP no sistema"""
@@ -303,23 +362,13 @@ class HandoffManager:
     @property
     def mcps(self):
         # Permite acesso tanto por Enum quanto por string
-        class MCPDict(dict):
-            def __contains__(self, key):
-                if hasattr(key, 'value'):
-                    return key.value in self
-                return super().__contains__(key)
-            
-            def __getitem__(self, key):
-                if hasattr(key, 'value'):
-                    return super().__getitem__(key.value)
-                return super().__getitem__(key)
-        
-        return MCPDict(self.mcps_registry)
+        return _MCPDict(self.mcps_registry)
 
     @property
     def circuit_breaker(self):
         # Retorna o breaker do agente 'orchestrator', ou o primeiro, ou o 'default'
-        return self.circuit_breakers.get('orchestrator') or next(iter(self.circuit_breakers.values()), None) or self.circuit_breakers.get('default')
+        breakers = self.circuit_breakers
+        return breakers.get('orchestrator') or next(iter(breakers.values()), None) or breakers.get('default')
 
     async def delegate(self, *args, **kwargs):
         if len(args) == 3:
@@ -331,7 +380,7 @@ class HandoffManager:
             raise TypeError("delegate() espera (context, target_agent) ou (source_agent, target_agent, context)")
         timeout = kwargs.get("timeout", self.timeouts[HandoffType.DELEGATION])
         key = target_agent.value if hasattr(target_agent, 'value') else target_agent
-        agent_instance = self.agents_registry.get(key)
+        agent_instance = self._resolve_agent(key)
         if agent_instance is None:
             raise HandoffError("Agente não encontrado")
         if hasattr(context, 'request_id'):
@@ -343,49 +392,30 @@ class HandoffManager:
         breaker = self.circuit_breakers.get(key) or self.circuit_breakers.get('default')
         if breaker and not breaker.can_execute():
             raise HandoffError("Circuit breaker aberto")
-        import asyncio
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             async def execute():
                 if key in ("slow", "slow_agent"):
                     await asyncio.sleep(timeout + 1)
                 if hasattr(agent_instance, 'should_fail') and agent_instance.should_fail:
                     raise Exception(f"Erro simulado em {key}")
-                if hasattr(agent_instance, 'process_with_handoffs'):
-                    if inspect.iscoroutinefunction(agent_instance.process_with_handoffs):
-                        return await agent_instance.process_with_handoffs(ctx)
-                    else:
-                        return agent_instance.process_with_handoffs(ctx)
-                if hasattr(agent_instance, 'process_request'):
-                    if inspect.iscoroutinefunction(agent_instance.process_request):
-                        return await agent_instance.process_request(ctx)
-                    else:
-                        return agent_instance.process_request(ctx)
-                if callable(agent_instance):
-                    if inspect.iscoroutinefunction(agent_instance):
-                        return await agent_instance(ctx)
-                    else:
-                        return agent_instance(ctx)
-                if hasattr(agent_instance, 'calls') and isinstance(agent_instance.calls, list):
-                    agent_instance.calls.append(("process_with_handoffs", ctx))
-                    return True
-                raise Exception("Agente não implementa process_request")
-            response = await asyncio.wait_for(execute(), timeout=timeout)
-            execution_time = time.time() - start_time
+                return await _dispatch_to_agent(agent_instance, HandoffType.DELEGATION, ctx)
+            async with asyncio.timeout(timeout):
+                response = await execute()
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_delegation(execution_time, True)
             return HandoffResult(success=True, response=response, context=ctx, execution_time=execution_time, agent_used=key, handoff_type=HandoffType.DELEGATION, data={"agent_id": key})
-        except asyncio.TimeoutError:
-            execution_time = time.time() - start_time
+        except TimeoutError:
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_delegation(execution_time, False)
             raise HandoffError("Timeout na delegação")
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_delegation(execution_time, False)
             if breaker:
                 breaker.record_failure()
-            if breaker and not breaker.can_execute():
-                raise HandoffError("Circuit breaker aberto")
+                if not breaker.can_execute():
+                    raise HandoffError("Circuit breaker aberto")
             raise HandoffError(f"Erro na delegação: {str(e)}")
 
     async def consult(self, *args, **kwargs):
@@ -405,17 +435,15 @@ class HandoffManager:
         else:
             ctx = context
         
-        import asyncio
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         breaker = self.circuit_breakers.get(key) or self.circuit_breakers.get('default')
         if breaker and not breaker.can_execute():
             raise HandoffError("Circuit breaker aberto")
         
         try:
-            if key in self.agents_registry:
-                agent_instance = self.agents_registry[key]
+            agent_instance = self._resolve_agent(key)
+            if agent_instance is not None:
                 
                 async def execute():
                     if key in ("slow", "slow_agent"):
@@ -425,46 +453,19 @@ class HandoffManager:
                     if hasattr(agent_instance, 'should_fail') and agent_instance.should_fail:
                         raise Exception(f"Erro simulado em {key}")
                     
-                    # Tenta chamar consult primeiro
-                    if hasattr(agent_instance, 'consult'):
-                        if inspect.iscoroutinefunction(agent_instance.consult):
-                            return await agent_instance.consult(query, ctx)
-                        else:
-                            return agent_instance.consult(query, ctx)
-                    
-                    # Se não tem consult, tenta process_request
-                    if hasattr(agent_instance, 'process_request'):
-                        if inspect.iscoroutinefunction(agent_instance.process_request):
-                            return await agent_instance.process_request(ctx)
-                        else:
-                            return agent_instance.process_request(ctx)
-                    
-                    # Se é callable diretamente
-                    if callable(agent_instance):
-                        if inspect.iscoroutinefunction(agent_instance):
-                            return await agent_instance(ctx)
-                        else:
-                            return agent_instance(ctx)
-                    
-                    # Se for mock com atributo 'calls', incremente manualmente
-                    if hasattr(agent_instance, 'calls') and isinstance(agent_instance.calls, list):
-                        agent_instance.calls.append(("consult", query, ctx))
-                        return True
-                    
-                    raise Exception("Agente não implementa consult")
+                    return await _dispatch_to_agent(agent_instance, HandoffType.CONSULTATION, ctx, query)
                 
-                response = await asyncio.wait_for(execute(), timeout=timeout)
+                async with asyncio.timeout(timeout):
+                    response = await execute()
             elif key in self.mcps_registry:
                 mcp_instance = self.mcps_registry[key]
                 
-                async def execute():
-                    return await mcp_instance.query(query, getattr(ctx, 'entities', {}))
-                
-                response = await asyncio.wait_for(execute(), timeout=timeout)
+                async with asyncio.timeout(timeout):
+                    response = await mcp_instance.query(query, getattr(ctx, 'entities', {}))
             else:
                 raise HandoffError("Agente ou MCP não encontrado")
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_consultation(execution_time, True)
             
             return HandoffResult(
@@ -476,12 +477,12 @@ class HandoffManager:
                 handoff_type=HandoffType.CONSULTATION, 
                 data={"agent_id": key, "query": query}
             )
-        except asyncio.TimeoutError:
-            execution_time = time.time() - start_time
+        except TimeoutError:
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_consultation(execution_time, False)
             raise HandoffError("Timeout na consulta")
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_consultation(execution_time, False)
             if breaker:
                 breaker.record_failure()
@@ -496,38 +497,17 @@ class HandoffManager:
         else:
             raise TypeError("escalate() espera (source_agent, target_agent, reason, context, [urgency])")
         
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         key = target_agent.value if hasattr(target_agent, 'value') else target_agent
-        agent_instance = self.agents_registry.get(key)
+        agent_instance = self._resolve_agent(key)
         
         if agent_instance is not None:
             try:
-                # Tenta chamar handle_escalation primeiro
-                if hasattr(agent_instance, 'handle_escalation'):
-                    if inspect.iscoroutinefunction(agent_instance.handle_escalation):
-                        await agent_instance.handle_escalation(context)
-                    else:
-                        agent_instance.handle_escalation(context)
-                # Se não tem handle_escalation, tenta process_request
-                elif hasattr(agent_instance, 'process_request'):
-                    if inspect.iscoroutinefunction(agent_instance.process_request):
-                        await agent_instance.process_request(context)
-                    else:
-                        agent_instance.process_request(context)
-                # Se é callable diretamente
-                elif callable(agent_instance):
-                    if inspect.iscoroutinefunction(agent_instance):
-                        await agent_instance(context)
-                    else:
-                        agent_instance(context)
-                # Se for mock com atributo 'calls', incremente manualmente
-                elif hasattr(agent_instance, 'calls') and isinstance(agent_instance.calls, list):
-                    agent_instance.calls.append(("handle_escalation", context))
+                await _dispatch_to_agent(agent_instance, HandoffType.ESCALATION, context)
             except Exception:
                 pass
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         return HandoffResult(
             success=True, 
@@ -558,18 +538,20 @@ class HandoffManager:
         else:
             ctx = context
         
-        import time
-        start_time = time.time()
-        results = []
+        start_time = time.perf_counter()
         
-        for agent in agents:
-            try:
-                result = await self.consult(agent, agent, task, ctx)
-                results.append(result)
-            except Exception as e:
-                results.append(HandoffResult(success=False, error=str(e), context=ctx))
+        # Consultas aos agentes são independentes: executa em paralelo
+        outcomes = await asyncio.gather(
+            *(self.consult(agent, agent, task, ctx) for agent in agents),
+            return_exceptions=True
+        )
+        results = [
+            HandoffResult(success=False, error=str(outcome), context=ctx)
+            if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         success = all(r.success for r in results)
         self.metrics.record_collaboration(execution_time, success)
         
@@ -604,39 +586,18 @@ class HandoffManager:
             ctx = context
             key = None
         
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        agent_instance = self.agents_registry.get(key)
+        agent_instance = self._resolve_agent(key)
         
         if agent_instance is not None:
             try:
-                # Tenta chamar validate primeiro
-                if hasattr(agent_instance, 'validate'):
-                    if inspect.iscoroutinefunction(agent_instance.validate):
-                        await agent_instance.validate(context)
-                    else:
-                        agent_instance.validate(context)
-                # Se não tem validate, tenta process_request
-                elif hasattr(agent_instance, 'process_request'):
-                    if inspect.iscoroutinefunction(agent_instance.process_request):
-                        await agent_instance.process_request(context)
-                    else:
-                        agent_instance.process_request(context)
-                # Se é callable diretamente
-                elif callable(agent_instance):
-                    if inspect.iscoroutinefunction(agent_instance):
-                        await agent_instance(context)
-                    else:
-                        agent_instance(context)
-                # Se for mock com atributo 'calls', incremente manualmente
-                elif hasattr(agent_instance, 'calls') and isinstance(agent_instance.calls, list):
-                    agent_instance.calls.append(("validate", context))
+                await _dispatch_to_agent(agent_instance, HandoffType.VALIDATION, context)
             except Exception:
                 pass
         
         is_approved = bool(response)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         self.metrics.record_validation(execution_time, True)
         
         return HandoffResult(
@@ -686,6 +647,8 @@ class HandoffManager:
 # HANDOFF METRICS
 # =============================
 
+_METRIC_FIELDS = itemgetter("total", "success", "failure", "total_duration", "avg_duration")
+
 class HandoffMetrics:
     """Métricas de performance dos handoffs"""
     
@@ -727,21 +690,20 @@ class HandoffMetrics:
         else:
             m["failure"] += 1
         m["total_duration"] += duration
-        m["avg_duration"] = m["total_duration"] / m["total"] if m["total"] > 0 else 0.0
+        m["avg_duration"] = m["total_duration"] / m["total"]
 
     def get_summary(self):
         """Retorna resumo das métricas"""
         summary = {}
         for key, m in self.metrics.items():
-            total = m["total"]
-            success_rate = m["success"] / total if total > 0 else 0.0
+            total, success, failure, total_duration, avg_duration = _METRIC_FIELDS(m)
             summary[key] = {
                 "total": total,
-                "success": m["success"],
-                "failure": m["failure"],
-                "success_rate": success_rate,
-                "total_duration": m["total_duration"],
-                "avg_duration": m["avg_duration"]
+                "success": success,
+                "failure": failure,
+                "success_rate": success / total if total > 0 else 0.0,
+                "total_duration": total_duration,
+                "avg_duration": avg_duration
             }
         return summary
 
@@ -754,12 +716,16 @@ class HandoffMetrics:
             m["total_duration"] = 0.0
             m["avg_duration"] = 0.0
 
+# Instância global
+handoff_manager = HandoffManager()
+
 # =============================
 # EXPORTS
 # =============================
 
 __all__ = [
     "HandoffManager",
+    "handoff_manager",
     "HandoffError", 
     "HandoffResult",
     "HandoffType",
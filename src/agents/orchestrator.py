@@ -1,7 +1,9 @@
 import asyncio
+import time
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
+from types import MappingProxyType
 import json
 
 from .router import MessageClassification, MessageCategory, UrgencyLevel
@@ -12,6 +14,27 @@ from src.agents.handoffs import AgentEnum, ContextObject
 logger = get_logger()
 settings = get_settings()
 
+# Conteúdo simulado baseado no tipo de agente e regras do prompt original
+_SIMULATED_CONTENT = MappingProxyType({
+    "weather_agent": "⚠ Informação meteorológica não disponível nas fontes oficiais consultadas (REDEMET, AISWEB, AIP MET). Recomenda-se consultar REDEMET ou AISWEB diretamente para dados METAR, TAF, SIGMET atualizados.",
+    "regulatory_agent": "⚠ Informação regulatória não disponível nas fontes oficiais consultadas (RBAC, IS, ANAC). Recomenda-se consultar RBAC ou IS específico na fonte ANAC com número, seção, parágrafo e data de verificação.",
+    "technical_agent": "⚠ Informação técnica não disponível nas fontes oficiais consultadas (POH/AFM, QRH, MEL, service bulletins). Recomenda-se consultar POH/AFM da aeronave específica com modelo, edição, seção e página.",
+    "operations_agent": "⚠ Informação operacional não disponível nas fontes oficiais consultadas (AIP Brasil, RBAC, ICAO Doc). Recomenda-se consultar AIP ENR ou documentação operacional para planejamento de voo, rotas e procedimentos.",
+    "education_agent": "⚠ Informação educacional não disponível nas fontes oficiais consultadas (RBAC 61/65, IS, Portal ANAC). Recomenda-se consultar Portal ANAC ou RBAC 61/65 para requisitos de licenças, horas de voo e exames.",
+    "communication_agent": "⚠ Informação de comunicação não disponível nas fontes oficiais consultadas (AIP GEN, glossários ANAC/ICAO). Recomenda-se consultar AIP GEN ou glossários oficiais para definição de termos e fraseologia."
+})
+
+# Fontes simuladas baseadas no prompt original
+_SIMULATED_SOURCES = MappingProxyType({
+    "weather_agent": ("REDEMET", "AISWEB", "AIP MET"),
+    "regulatory_agent": ("RBAC", "IS", "Portal ANAC"),
+    "technical_agent": ("POH/AFM", "QRH", "MEL", "Service Bulletins"),
+    "operations_agent": ("AIP Brasil", "RBAC", "ICAO Doc"),
+    "education_agent": ("RBAC 61/65", "IS", "Portal ANAC"),
+    "communication_agent": ("AIP GEN", "Glossários ANAC/ICAO")
+})
+_DEFAULT_SIMULATED_SOURCES = ("Fonte não especificada",)
+
 @dataclass
 class AgentResponse:
     """Resposta de um agente especialista"""
@@ -188,38 +211,44 @@ class StratusOrchestratorAgent:
             )
             return [social_response]
         
-        # Executar agentes recomendados
-        for agent_name in classification.recommended_agents:
-            if agent_name in self.available_agents:
-                try:
-                    # TODO: Implementar chamada real para agentes quando estiverem prontos
-                    # Por enquanto, simular resposta baseada no prompt original
-                    response = await self._simulate_agent_call(
-                        agent_name, message, classification, user_id
-                    )
-                    agent_responses.append(response)
-                    
-                except Exception as e:
-                    error_response = AgentResponse(
-                        agent_name=agent_name,
-                        category=classification.primary_category.value,
-                        content="",
-                        sources=[],
-                        confidence=0.0,
-                        timestamp=datetime.now(timezone.utc),
-                        success=False,
-                        error_message=str(e)
-                    )
-                    agent_responses.append(error_response)
-                    
-                    logger.log_agent_action(
-                        agent_name=self.name,
-                        action="execute_agent",
-                        message=f"Erro ao executar {agent_name}: {str(e)}",
-                        user_id=user_id,
-                        success=False,
-                        additional_context={"agent": agent_name, "error": str(e)}
-                    )
+        # Executar agentes recomendados em paralelo (chamadas independentes)
+        agent_names = [
+            agent_name for agent_name in classification.recommended_agents
+            if agent_name in self.available_agents
+        ]
+        # TODO: Implementar chamada real para agentes quando estiverem prontos
+        # Por enquanto, simular resposta baseada no prompt original
+        results = await asyncio.gather(
+            *(self._simulate_agent_call(agent_name, message, classification, user_id)
+              for agent_name in agent_names),
+            return_exceptions=True
+        )
+        
+        for agent_name, result in zip(agent_names, results):
+            if not isinstance(result, BaseException):
+                agent_responses.append(result)
+                continue
+            
+            error_response = AgentResponse(
+                agent_name=agent_name,
+                category=classification.primary_category.value,
+                content="",
+                sources=[],
+                confidence=0.0,
+                timestamp=datetime.now(timezone.utc),
+                success=False,
+                error_message=str(result)
+            )
+            agent_responses.append(error_response)
+            
+            logger.log_agent_action(
+                agent_name=self.name,
+                action="execute_agent",
+                message=f"Erro ao executar {agent_name}: {str(result)}",
+                user_id=user_id,
+                success=False,
+                additional_context={"agent": agent_name, "error": str(result)}
+            )
         
         return agent_responses
 
@@ -231,31 +260,11 @@ class StratusOrchestratorAgent:
         # Simular delay de processamento
         await asyncio.sleep(0.1)
         
-        # Conteúdo simulado baseado no tipo de agente e regras do prompt original
-        simulated_content = {
-            "weather_agent": "⚠ Informação meteorológica não disponível nas fontes oficiais consultadas (REDEMET, AISWEB, AIP MET). Recomenda-se consultar REDEMET ou AISWEB diretamente para dados METAR, TAF, SIGMET atualizados.",
-            "regulatory_agent": "⚠ Informação regulatória não disponível nas fontes oficiais consultadas (RBAC, IS, ANAC). Recomenda-se consultar RBAC ou IS específico na fonte ANAC com número, seção, parágrafo e data de verificação.",
-            "technical_agent": "⚠ Informação técnica não disponível nas fontes oficiais consultadas (POH/AFM, QRH, MEL, service bulletins). Recomenda-se consultar POH/AFM da aeronave específica com modelo, edição, seção e página.",
-            "operations_agent": "⚠ Informação operacional não disponível nas fontes oficiais consultadas (AIP Brasil, RBAC, ICAO Doc). Recomenda-se consultar AIP ENR ou documentação operacional para planejamento de voo, rotas e procedimentos.",
-            "education_agent": "⚠ Informação educacional não disponível nas fontes oficiais consultadas (RBAC 61/65, IS, Portal ANAC). Recomenda-se consultar Portal ANAC ou RBAC 61/65 para requisitos de licenças, horas de voo e exames.",
-            "communication_agent": "⚠ Informação de comunicação não disponível nas fontes oficiais consultadas (AIP GEN, glossários ANAC/ICAO). Recomenda-se consultar AIP GEN ou glossários oficiais para definição de termos e fraseologia."
-        }
-        
-        # Fontes simuladas baseadas no prompt original
-        simulated_sources = {
-            "weather_agent": ["REDEMET", "AISWEB", "AIP MET"],
-            "regulatory_agent": ["RBAC", "IS", "Portal ANAC"],
-            "technical_agent": ["POH/AFM", "QRH", "MEL", "Service Bulletins"],
-            "operations_agent": ["AIP Brasil", "RBAC", "ICAO Doc"],
-            "education_agent": ["RBAC 61/65", "IS", "Portal ANAC"],
-            "communication_agent": ["AIP GEN", "Glossários ANAC/ICAO"]
-        }
-        
         return AgentResponse(
             agent_name=agent_name,
             category=classification.primary_category.value,
-            content=simulated_content.get(agent_name, "Informação não disponível."),
-            sources=simulated_sources.get(agent_name, ["Fonte não especificada"]),
+            content=_SIMULATED_CONTENT.get(agent_name, "Informação não disponível."),
+            sources=list(_SIMULATED_SOURCES.get(agent_name, _DEFAULT_SIMULATED_SOURCES)),
             confidence=0.5,
             timestamp=datetime.now(timezone.utc),
             success=True
@@ -390,7 +399,7 @@ class StratusOrchestratorAgent:
                          user_id: str = "system") -> SynthesizedResponse:
         """Orquestra execução completa e síntese de resposta"""
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         logger.log_agent_action(
             agent_name=self.name,
@@ -448,7 +457,7 @@ class StratusOrchestratorAgent:
         )
         
         # Log final
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         logger.log_agent_action(
             agent_name=self.name,
             action="orchestrate_complete",
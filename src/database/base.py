@@ -11,6 +11,26 @@ import uuid
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(value: Any) -> str:
+    """Serializa valor para JSON (orjson quando disponível)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Desserializa JSON (orjson quando disponível)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Enums para classificação
 class MessageType(Enum):
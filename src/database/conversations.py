@@ -4,12 +4,11 @@ Gerenciador de histórico de conversas completo com sumarização automática
 """
 
 import asyncio
-import json
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from .base import MessageType, ConversationStatus, ConversationMessage, ConversationSession
+from .base import MessageType, ConversationStatus, ConversationMessage, ConversationSession, json_dumps, json_loads
 from .integration import StratusPostgreSQLIntegration
 from src.utils.logging import get_logger
 
@@ -61,7 +60,7 @@ class StratusConversationHistory:
                 await session.execute(
                     insert_query,
                     conversation_id, user_id, title, conversation.status.value,
-                    json.dumps(conversation.context), conversation.started_at,
+                    json_dumps(conversation.context), conversation.started_at,
                     conversation.last_message_at
                 )
             
@@ -133,7 +132,7 @@ class StratusConversationHistory:
                 await session.execute(
                     insert_query,
                     message_id, conversation_id, user_id, agent_name,
-                    message_type.value, content, json.dumps(message.metadata),
+                    message_type.value, content, json_dumps(message.metadata),
                     message.timestamp, tokens_used, response_time
                 )
             
@@ -179,7 +178,7 @@ class StratusConversationHistory:
                 user_id=row['user_id'],
                 title=row['title'],
                 status=ConversationStatus(row['status']),
-                context=json.loads(row['context']) if row['context'] else {},
+                context=json_loads(row['context']) if row['context'] else {},
                 summary=row['summary'],
                 started_at=row['started_at'],
                 last_message_at=row['last_message_at'],
@@ -237,7 +236,7 @@ class StratusConversationHistory:
                     agent_name=row['agent_name'],
                     message_type=MessageType(row['message_type']),
                     content=row['content'],
-                    metadata=json.loads(row['metadata']) if row['metadata'] else {},
+                    metadata=json_loads(row['metadata']) if row['metadata'] else {},
                     timestamp=row['timestamp'],
                     tokens_used=row['tokens_used'],
                     response_time=row['response_time']
@@ -288,7 +287,7 @@ class StratusConversationHistory:
                     user_id=row['user_id'],
                     title=row['title'],
                     status=ConversationStatus(row['status']),
-                    context=json.loads(row['context']) if row['context'] else {},
+                    context=json_loads(row['context']) if row['context'] else {},
                     summary=row['summary'],
                     started_at=row['started_at'],
                     last_message_at=row['last_message_at'],
@@ -361,7 +360,7 @@ class StratusConversationHistory:
                     user_id=row['user_id'],
                     title=row['title'],
                     status=ConversationStatus(row['status']),
-                    context=json.loads(row['context']) if row['context'] else {},
+                    context=json_loads(row['context']) if row['context'] else {},
                     summary=row['summary'],
                     started_at=row['started_at'],
                     last_message_at=row['last_message_at'],
@@ -15,11 +15,11 @@ from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 import asyncpg
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Index, Float
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Index, Float, func
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.dialects.postgresql import JSONB
 
-from .base import DatabaseMetrics
+from .base import DatabaseMetrics, json_dumps, json_loads
 
 
 class StratusPostgreSQLIntegration:
@@ -37,6 +37,8 @@ class StratusPostgreSQLIntegration:
             max_overflow=30,
             pool_pre_ping=True,
             pool_recycle=3600,
+            json_serializer=json_dumps,
+            json_deserializer=json_loads,
             connect_args={
                 "server_settings": {
                     "application_name": "stratus_ia",
@@ -82,8 +84,8 @@ class StratusPostgreSQLIntegration:
             Column('preferred_language', String(10), default='pt-BR'),
             Column('timezone', String(50), default='America/Sao_Paulo'),
             Column('preferences', JSONB),
-            Column('created_at', DateTime, default=datetime.now),
-            Column('last_active', DateTime, default=datetime.now),
+            Column('created_at', DateTime, server_default=func.now()),
+            Column('last_active', DateTime, server_default=func.now()),
             Column('is_active', Boolean, default=True),
             Index('idx_users_email', 'email'),
             Index('idx_users_role', 'role'),
@@ -100,8 +102,8 @@ class StratusPostgreSQLIntegration:
             Column('status', String(20), default='active'),
             Column('context', JSONB),
             Column('summary', Text),
-            Column('started_at', DateTime, default=datetime.now),
-            Column('last_message_at', DateTime, default=datetime.now),
+            Column('started_at', DateTime, server_default=func.now()),
+            Column('last_message_at', DateTime, server_default=func.now()),
             Column('message_count', Integer, default=0),
             Column('total_tokens', Integer, default=0),
             Index('idx_conversations_user_id', 'user_id'),
@@ -120,7 +122,7 @@ class StratusPostgreSQLIntegration:
             Column('message_type', String(20), nullable=False),
             Column('content', Text, nullable=False),
             Column('metadata', JSONB),
-            Column('timestamp', DateTime, default=datetime.now),
+            Column('timestamp', DateTime, server_default=func.now()),
             Column('tokens_used', Integer),
             Column('response_time', Float),
             Index('idx_messages_conversation_id', 'conversation_id'),
@@ -141,8 +143,8 @@ class StratusPostgreSQLIntegration:
             Column('context', JSONB),
             Column('importance_score', Float, default=0.5),
             Column('access_count', Integer, default=0),
-            Column('created_at', DateTime, default=datetime.now),
-            Column('last_accessed', DateTime, default=datetime.now),
+            Column('created_at', DateTime, server_default=func.now()),
+            Column('last_accessed', DateTime, server_default=func.now()),
             Column('expires_at', DateTime),
             Index('idx_memory_user_id', 'user_id'),
             Index('idx_memory_type', 'memory_type'),
@@ -162,7 +164,7 @@ class StratusPostgreSQLIntegration:
             Column('record_id', String(36)),
             Column('old_values', JSONB),
             Column('new_values', JSONB),
-            Column('timestamp', DateTime, default=datetime.now),
+            Column('timestamp', DateTime, server_default=func.now()),
             Column('ip_address', String(45)),
             Column('user_agent', String(500)),
             Index('idx_audit_user_id', 'user_id'),
@@ -4,13 +4,12 @@ Gerenciador de memória inteligente com análise de importância e TTL
 """
 
 import asyncio
-import json
 import uuid
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from .base import MemoryType, MemoryEntry
+from .base import MemoryType, MemoryEntry, json_dumps, json_loads
 from .integration import StratusPostgreSQLIntegration
 from src.utils.logging import get_logger
 
@@ -105,7 +104,7 @@ class StratusMemoryManager:
                 await session.execute(
                     insert_query,
                     memory_id, user_id, correlation_id, memory_type.value, key, 
-                    json.dumps(value), json.dumps(memory_entry.context),
+                    json_dumps(value), json_dumps(memory_entry.context),
                     importance_score, memory_entry.created_at, 
                     memory_entry.last_accessed, expires_at
                 )
@@ -184,8 +183,8 @@ class StratusMemoryManager:
                     correlation_id=row['correlation_id'],
                     memory_type=MemoryType(row['memory_type']),
                     key=row['key'],
-                    value=json.loads(row['value']),
-                    context=json.loads(row['context']) if row['context'] else {},
+                    value=json_loads(row['value']),
+                    context=json_loads(row['context']) if row['context'] else {},
                     importance_score=row['importance_score'],
                     access_count=row['access_count'],
                     created_at=row['created_at'],
@@ -199,8 +198,7 @@ class StratusMemoryManager:
                 self.active_memory[cache_key] = memory_entry
             
             # Atualiza contadores de acesso
-            for entry in memory_entries:
-                await self._update_access_count(entry.memory_id)
+            await self._update_access_counts(memory_entries)
             
             return memory_entries
             
@@ -258,8 +256,8 @@ class StratusMemoryManager:
                     correlation_id=row['correlation_id'],
                     memory_type=MemoryType(row['memory_type']),
                     key=row['key'],
-                    value=json.loads(row['value']),
-                    context=json.loads(row['context']) if row['context'] else {},
+                    value=json_loads(row['value']),
+                    context=json_loads(row['context']) if row['context'] else {},
                     importance_score=row['importance_score'],
                     access_count=row['access_count'],
                     created_at=row['created_at'],
@@ -291,7 +289,7 @@ class StratusMemoryManager:
             if value is not None:
                 param_count += 1
                 updates.append(f"value = ${param_count}")
-                params.append(json.dumps(value))
+                params.append(json_dumps(value))
             
             if importance_score is not None:
                 param_count += 1
@@ -301,7 +299,7 @@ class StratusMemoryManager:
             if context is not None:
                 param_count += 1
                 updates.append(f"context = ${param_count}")
-                params.append(json.dumps(context))
+                params.append(json_dumps(context))
             
             if not updates:
                 return True
@@ -504,6 +502,27 @@ class StratusMemoryManager:
         except Exception as e:
             self.logger._log_error(f"Failed to enforce memory limits: {str(e)}")
     
+    async def _update_access_counts(self, memory_entries: List[MemoryEntry]):
+        """Atualiza contadores de acesso em uma única consulta"""
+        
+        if not memory_entries:
+            return
+        
+        try:
+            query = """
+            UPDATE memory_entries 
+            SET access_count = access_count + 1, last_accessed = NOW()
+            WHERE memory_id = ANY($1)
+            """
+            
+            await self.db.execute_query(
+                query,
+                {"$1": [entry.memory_id for entry in memory_entries]}
+            )
+            
+        except Exception as e:
+            self.logger._log_warning(f"Failed to update access counts: {str(e)}")
+    
     async def _update_access_count(self, memory_id: str):
         """Atualiza contador de acesso"""
         
@@ -590,8 +609,8 @@ class StratusMemoryManager:
                     correlation_id=row['correlation_id'],
                     memory_type=MemoryType(row['memory_type']),
                     key=row['key'],
-                    value=json.loads(row['value']),
-                    context=json.loads(row['context']) if row['context'] else {},
+                    value=json_loads(row['value']),
+                    context=json_loads(row['context']) if row['context'] else {},
                     importance_score=row['importance_score'],
                     access_count=row['access_count'],
                     created_at=row['created_at'],
@@ -605,8 +624,7 @@ class StratusMemoryManager:
                 self.active_memory[cache_key] = memory_entry
             
             # Atualiza contadores de acesso
-            for entry in memory_entries:
-                await self._update_access_count(entry.memory_id)
+            await self._update_access_counts(memory_entries)
             
             self.logger._log_info(
                 f"Retrieved {len(memory_entries)} memories by correlation_id {correlation_id}",
@@ -60,6 +60,9 @@ class StratusDatabaseSystem:
             # Para tarefas de manutenção
             for task in self.maintenance_tasks:
                 task.cancel()
+            # Aguarda o cancelamento para não deixar tarefas órfãs no event loop
+            await asyncio.gather(*self.maintenance_tasks, return_exceptions=True)
+            self.maintenance_tasks.clear()
             
             # Fecha conexões
             await self.db_integration.close()
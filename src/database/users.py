@@ -3,11 +3,10 @@ User Context Storage para Stratus.IA
 Armazenamento de contexto do usuário com cache e operações completas
 """
 
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from .base import UserProfile, UserRole
+from .base import UserProfile, UserRole, json_dumps, json_loads
 from .integration import StratusPostgreSQLIntegration
 from src.utils.logging import get_logger
 
@@ -40,9 +39,9 @@ class StratusUserContextStorage:
                 await session.execute(
                     insert_query,
                     user_profile.user_id, user_profile.name, user_profile.email,
-                    user_profile.role.value, json.dumps(user_profile.licenses),
+                    user_profile.role.value, json_dumps(user_profile.licenses),
                     user_profile.experience_level, user_profile.preferred_language,
-                    user_profile.timezone, json.dumps(user_profile.preferences),
+                    user_profile.timezone, json_dumps(user_profile.preferences),
                     user_profile.created_at, user_profile.last_active
                 )
             
@@ -78,11 +77,11 @@ class StratusUserContextStorage:
                 name=row['name'],
                 email=row['email'],
                 role=UserRole(row['role']),
-                licenses=json.loads(row['licenses']) if row['licenses'] else [],
+                licenses=json_loads(row['licenses']) if row['licenses'] else [],
                 experience_level=row['experience_level'],
                 preferred_language=row['preferred_language'],
                 timezone=row['timezone'],
-                preferences=json.loads(row['preferences']) if row['preferences'] else {},
+                preferences=json_loads(row['preferences']) if row['preferences'] else {},
                 created_at=row['created_at'],
                 last_active=row['last_active']
             )
@@ -121,7 +120,7 @@ class StratusUserContextStorage:
                     
                     # Serializa JSON se necessário
                     if field in ['licenses', 'preferences']:
-                        params.append(json.dumps(value))
+                        params.append(json_dumps(value))
                     elif field == 'role':
                         params.append(value.value if isinstance(value, UserRole) else value)
                     else:
@@ -233,11 +232,11 @@ class StratusUserContextStorage:
                     name=row['name'],
                     email=row['email'],
                     role=UserRole(row['role']),
-                    licenses=json.loads(row['licenses']) if row['licenses'] else [],
+                    licenses=json_loads(row['licenses']) if row['licenses'] else [],
                     experience_level=row['experience_level'],
                     preferred_language=row['preferred_language'],
                     timezone=row['timezone'],
-                    preferences=json.loads(row['preferences']) if row['preferences'] else {},
+                    preferences=json_loads(row['preferences']) if row['preferences'] else {},
                     created_at=row['created_at'],
                     last_active=row['last_active']
                 )
@@ -148,14 +148,18 @@ def get_tools_by_category(category: str):
     
     return tools
 
-# Registra MCPs no HandoffManager
-handoff_manager.register_mcp(MCPEnum.REDEMET, RedemetMCPServer)
-handoff_manager.register_mcp(MCPEnum.AISWEB, AISWEBMCPServer)
-handoff_manager.register_mcp(MCPEnum.PINECONE, PineconeMCPServer)
-handoff_manager.register_mcp(MCPEnum.AIRPORTDB, AirportDBMCPServer)
-handoff_manager.register_mcp(MCPEnum.WEATHER_APIS, AviationWeatherGovMCPServer)
-handoff_manager.register_mcp(MCPEnum.ANAC_REGULATIONS, ANACRegulationsMCPServer)
-# Adicione outros MCPs conforme necessário
+# Registra MCPs no HandoffManager (pares enum -> servidor)
+MCP_REGISTRATIONS = (
+    (MCPEnum.REDEMET, RedemetMCPServer),
+    (MCPEnum.AISWEB, AISWEBMCPServer),
+    (MCPEnum.PINECONE, PineconeMCPServer),
+    (MCPEnum.AIRPORTDB, AirportDBMCPServer),
+    (MCPEnum.WEATHER_APIS, AviationWeatherGovMCPServer),
+    (MCPEnum.ANAC_REGULATIONS, ANACRegulationsMCPServer),
+    # Adicione outros MCPs conforme necessário
+)
+for mcp_type, mcp_server in MCP_REGISTRATIONS:
+    handoff_manager.register_mcp(mcp_type, mcp_server)
 
 # Exportar tudo
 __all__ = [
@@ -169,7 +173,7 @@ __all__ = [
     'ALL_MCP_TOOLS',
     
     # Configurações
-    'ALL_MCP_SERVERS', 'MCP_STATISTICS', 'CACHE_CONFIGURATIONS', 'CIRCUIT_BREAKER_CONFIGURATIONS',
+    'ALL_MCP_SERVERS', 'MCP_REGISTRATIONS', 'MCP_STATISTICS', 'CACHE_CONFIGURATIONS', 'CIRCUIT_BREAKER_CONFIGURATIONS',
     
     # Funções utilitárias
     'get_mcp_server', 'get_mcp_tool', 'list_available_servers', 'list_available_tools', 'get_tools_by_category',
@@ -1,11 +1,15 @@
 import asyncio
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Tuple
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime, timezone
 import json
 import hashlib
 import re
+import time
+import weakref
 # from pinecone import Pinecone, ServerlessSpec  # Descomente quando Pinecone estiver instalado
 # from openai import AsyncOpenAI  # Descomente quando OpenAI estiver instalado
 
@@ -24,7 +28,7 @@ class NamespaceCategory(Enum):
     COMMUNICATION = "communication"
     EDUCATION = "education"
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceConfig:
     name: str
     tool_name: str
@@ -34,7 +38,7 @@ class NamespaceConfig:
     priority: int
     safety_critical: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class VectorSearchResult:
     namespace: str
     content: str
@@ -46,7 +50,7 @@ class VectorSearchResult:
         if self.retrieved_at is None:
             self.retrieved_at = datetime.now(timezone.utc)
 
-@dataclass
+@dataclass(slots=True)
 class PineconeResponse:
     query: str
     namespaces_searched: List[str]
@@ -57,6 +61,31 @@ class PineconeResponse:
 
 class PineconeMCPServer:
     """Servidor MCP Pinecone - Base Vetorial de Conhecimento Aeronáutico"""
+
+    # Grupos de namespaces das buscas multi-namespace
+    REGULATION_NAMESPACES = ("ANAC", "DECEA", "ICAO e seus Anexos", "ProcedimentosOperacionais")
+    NAVIGATION_NAMESPACES = ("AIP_Brasil_Map", "Jeppesen_Manuais", "Planejamento_de_Voo")
+    AIRCRAFT_NAMESPACES = ("Manuais_Aeronaves_Equipamentos", "InstrumentosAvionicosSistemasEletricos", "PesoBalanceamento_Performance")
+    EDUCATION_NAMESPACES = ("MaterialFormacao_BancaANAC_Simulados", "InstrutoresDeVoo", "Exame SDEA ICAO ANAC", "Miscelanea")
+
+    # Limite de consultas simultâneas ao índice (rate limit do Pinecone), válido para
+    # o processo inteiro: um semáforo por event loop, compartilhado entre instâncias
+    MAX_CONCURRENT_SEARCHES = 8
+    _search_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+    # Embeddings de consultas mantidos em memória, compartilhados pelo processo
+    # (cada chamada cria sua própria instância do servidor)
+    EMBEDDING_CACHE_SIZE = 1024
+    _embedding_cache: "OrderedDict[str, array]" = OrderedDict()
+
+    @classmethod
+    def _search_semaphore(cls) -> asyncio.Semaphore:
+        """Semáforo de consultas ao índice do event loop em execução (criado no primeiro uso)"""
+        loop = asyncio.get_running_loop()
+        semaphore = cls._search_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._search_semaphores[loop] = asyncio.Semaphore(cls.MAX_CONCURRENT_SEARCHES)
+        return semaphore
+
     def __init__(self):
         self.index_name = "stratus"
         self.embedding_model = "text-embedding-3-small"
@@ -233,6 +262,26 @@ class PineconeMCPServer:
                 timeout_duration=10,
                 half_open_max_calls=1
             )
+        self.safety_namespaces = tuple(ns for ns, config in self.namespaces.items() if config.safety_critical)
+
+    async def search_many_queries(self, queries: List[str], namespace: str, top_k: int = 10,
+                                  user_id: str = "system") -> List[Union[PineconeResponse, Exception]]:
+        """Busca concorrente de várias consultas em um mesmo namespace"""
+        distinct_queries = list(dict.fromkeys(queries))
+        embeddings = await asyncio.gather(
+            *(self._generate_embedding(query) for query in distinct_queries),
+            return_exceptions=True
+        )
+        embedding_by_query = {
+            query: embedding for query, embedding in zip(distinct_queries, embeddings)
+            if not isinstance(embedding, Exception)
+        }
+        return await asyncio.gather(
+            *(self.search_knowledge_base(query, [namespace], top_k, user_id,
+                                         query_embedding=embedding_by_query.get(query))
+              for query in queries),
+            return_exceptions=True
+        )
 
     # Métodos de busca para os 4 primeiros namespaces
     async def search_anac(self, query: str, top_k: int = 10, user_id: str = "system") -> PineconeResponse:
@@ -308,28 +357,23 @@ class PineconeMCPServer:
     # Métodos multi-namespace
     async def search_regulations(self, query: str, top_k: int = 15, user_id: str = "system") -> PineconeResponse:
         """Busca em todos os namespaces de regulamentação"""
-        regulation_namespaces = ["ANAC", "DECEA", "ICAO e seus Anexos", "ProcedimentosOperacionais"]
-        return await self.search_knowledge_base(query, regulation_namespaces, top_k, user_id)
+        return await self.search_knowledge_base(query, list(self.REGULATION_NAMESPACES), top_k, user_id)
 
     async def search_navigation(self, query: str, top_k: int = 15, user_id: str = "system") -> PineconeResponse:
         """Busca em todos os namespaces de navegação"""
-        navigation_namespaces = ["AIP_Brasil_Map", "Jeppesen_Manuais", "Planejamento_de_Voo"]
-        return await self.search_knowledge_base(query, navigation_namespaces, top_k, user_id)
+        return await self.search_knowledge_base(query, list(self.NAVIGATION_NAMESPACES), top_k, user_id)
 
     async def search_aircraft_systems(self, query: str, top_k: int = 15, user_id: str = "system") -> PineconeResponse:
         """Busca em todos os namespaces de aeronaves e sistemas"""
-        aircraft_namespaces = ["Manuais_Aeronaves_Equipamentos", "InstrumentosAvionicosSistemasEletricos", "PesoBalanceamento_Performance"]
-        return await self.search_knowledge_base(query, aircraft_namespaces, top_k, user_id)
+        return await self.search_knowledge_base(query, list(self.AIRCRAFT_NAMESPACES), top_k, user_id)
 
     async def search_education(self, query: str, top_k: int = 15, user_id: str = "system") -> PineconeResponse:
         """Busca em todos os namespaces de educação"""
-        education_namespaces = ["MaterialFormacao_BancaANAC_Simulados", "InstrutoresDeVoo", "Exame SDEA ICAO ANAC", "Miscelanea"]
-        return await self.search_knowledge_base(query, education_namespaces, top_k, user_id)
+        return await self.search_knowledge_base(query, list(self.EDUCATION_NAMESPACES), top_k, user_id)
 
     async def search_safety_critical(self, query: str, top_k: int = 20, user_id: str = "system") -> PineconeResponse:
         """Busca em todos os namespaces críticos para segurança"""
-        safety_namespaces = [ns for ns, config in self.namespaces.items() if config.safety_critical]
-        return await self.search_knowledge_base(query, safety_namespaces, top_k, user_id)
+        return await self.search_knowledge_base(query, list(self.safety_namespaces), top_k, user_id)
 
     # O restante da implementação será adicionado nas próximas etapas.
 
@@ -417,23 +461,22 @@ class PineconeMCPServer:
         
         # Always include safety-critical namespaces for safety queries
         if context["safety_critical"]:
-            safety_namespaces = [ns for ns, config in self.namespaces.items() if config.safety_critical]
-            relevant_namespaces.extend(safety_namespaces)
+            relevant_namespaces.extend(self.safety_namespaces)
         
         # Regulation-related keywords
         regulation_keywords = ['rbac', 'anac', 'decea', 'icao', 'regulament', 'norma', 'is ', 'iac']
         if any(keyword in query_lower for keyword in regulation_keywords):
-            relevant_namespaces.extend(['ANAC', 'DECEA', 'ICAO e seus Anexos', 'ProcedimentosOperacionais'])
+            relevant_namespaces.extend(self.REGULATION_NAMESPACES)
         
         # Navigation-related keywords
         navigation_keywords = ['carta', 'aip', 'jeppesen', 'navegação', 'rota', 'planejamento', 'ifr', 'vfr']
         if any(keyword in query_lower for keyword in navigation_keywords):
-            relevant_namespaces.extend(['AIP_Brasil_Map', 'Jeppesen_Manuais', 'Planejamento_de_Voo'])
+            relevant_namespaces.extend(self.NAVIGATION_NAMESPACES)
         
         # Aircraft-related keywords
         aircraft_keywords = ['aeronave', 'aircraft', 'manual', 'poh', 'afm', 'performance', 'peso', 'balanceamento']
         if any(keyword in query_lower for keyword in aircraft_keywords) or context["aircraft_types"]:
-            relevant_namespaces.extend(['Manuais_Aeronaves_Equipamentos', 'InstrumentosAvionicosSistemasEletricos', 'PesoBalanceamento_Performance'])
+            relevant_namespaces.extend(self.AIRCRAFT_NAMESPACES)
         
         # Communication-related keywords
         comm_keywords = ['comunicação', 'fonia', 'radio', 'fraseologia', 'atc', 'torre', 'controle']
@@ -475,6 +518,21 @@ class PineconeMCPServer:
 
     async def _generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text using OpenAI"""
+        cache = PineconeMCPServer._embedding_cache
+        cached = cache.get(text)
+        if cached is not None:
+            cache.move_to_end(text)
+            return cached.tolist()
+        
+        embedding = await self._create_embedding(text)
+        # array('d') guarda os floats sem perda, em bloco contíguo
+        cache[text] = array('d', embedding)
+        if len(cache) > self.EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return embedding
+
+    async def _create_embedding(self, text: str) -> List[float]:
+        """Chama o modelo de embeddings (sem cache)"""
         try:
             # Mock embedding for now - replace with actual OpenAI call
             # response = await self.openai_client.embeddings.create(
@@ -549,7 +607,8 @@ class PineconeMCPServer:
         # Retry logic with exponential backoff
         for attempt in range(3):
             try:
-                return await _search()
+                async with self._search_semaphore():
+                    return await _search()
             except Exception as e:
                 if attempt == 2:  # Last attempt
                     # Log safety violation for critical namespaces
@@ -567,10 +626,11 @@ class PineconeMCPServer:
                 await asyncio.sleep(delay)
 
     async def search_knowledge_base(self, query: str, namespaces: Optional[List[str]] = None, 
-                                   top_k: int = None, user_id: str = "system") -> PineconeResponse:
-        """Search the knowledge base across specified namespaces"""
+                                   top_k: int = None, user_id: str = "system",
+                                   query_embedding: Optional[List[float]] = None) -> PineconeResponse:
+        """Search the knowledge base across specified namespaces (reusing query_embedding if given)"""
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         if top_k is None:
             top_k = self.default_top_k
@@ -597,7 +657,8 @@ class PineconeMCPServer:
         
         try:
             # Generate embedding
-            query_embedding = await self._generate_embedding(query)
+            if query_embedding is None:
+                query_embedding = await self._generate_embedding(query)
             
             # Search all namespaces in parallel
             search_tasks = []
@@ -638,7 +699,7 @@ class PineconeMCPServer:
             final_results = all_results[:top_k * 2]  # Allow more results for better ranking
             
             # Calculate search time
-            search_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            search_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
             response = PineconeResponse(
                 query=query,
@@ -825,6 +886,113 @@ async def search_knowledge_base_tool(query: str, namespaces: Optional[List[str]]
         result = await server.search_knowledge_base(query, namespaces, top_k, user_id)
         return asdict(result)
 
+# Interface consumida pelos agentes auxiliares ({"success", "matches"})
+def _response_matches(response: PineconeResponse) -> List[Dict[str, Any]]:
+    """Converte os resultados de uma resposta em matches"""
+    return [
+        {
+            "content": result.content,
+            "source": result.source,
+            "score": result.score,
+            "namespace": result.namespace,
+            "metadata": result.metadata
+        }
+        for result in response.results
+    ]
+
+# Cache LRU/TTL compartilhado das consultas dos agentes, por (namespace, consulta
+# normalizada, top_k): variantes de caixa e espaçamento reaproveitam a mesma busca
+KNOWLEDGE_CACHE_SIZE = 2048
+KNOWLEDGE_CACHE_TTL = 900.0
+_knowledge_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_knowledge_inflight: Dict[Tuple[str, str, int], asyncio.Future] = {}
+# Resultado entregue a quem aguardava uma busca cujo dono foi cancelado
+_OWNER_CANCELLED = object()
+
+def _knowledge_key(namespace: str, query: str, top_k: int) -> Tuple[str, str, int]:
+    """Chave do cache de conhecimento, sem diferenças de caixa e espaçamento"""
+    return namespace, " ".join(query.split()).casefold(), top_k
+
+async def _search_matches(queries: List[str], namespace: str, top_k: int,
+                          user_id: str) -> List[Union[List[Dict[str, Any]], BaseException]]:
+    """Matches por consulta: usa o cache e aguarda buscas idênticas já em andamento"""
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+    results: Dict[str, Union[List[Dict[str, Any]], BaseException]] = {}
+    pending: Dict[str, asyncio.Future] = {}
+    owned: List[str] = []
+    for query in dict.fromkeys(queries):
+        key = _knowledge_key(namespace, query, top_k)
+        cached = _knowledge_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _knowledge_cache.move_to_end(key)
+            results[query] = cached[1]
+        elif key in _knowledge_inflight:
+            pending[query] = _knowledge_inflight[key]
+        else:
+            # Esta chamada assume a busca; chamadas concorrentes aguardam o futuro
+            _knowledge_inflight[key] = loop.create_future()
+            pending[query] = _knowledge_inflight[key]
+            owned.append(query)
+
+    if owned:
+        try:
+            try:
+                async with PineconeMCPServer() as server:
+                    responses = await server.search_many_queries(owned, namespace, top_k, user_id)
+            except Exception as e:
+                responses = [e] * len(owned)
+            expires_at = time.monotonic() + KNOWLEDGE_CACHE_TTL
+            for query, response in zip(owned, responses):
+                if isinstance(response, Exception):
+                    value = response
+                else:
+                    value = _response_matches(response)
+                    _knowledge_cache[_knowledge_key(namespace, query, top_k)] = (expires_at, value)
+                    if len(_knowledge_cache) > KNOWLEDGE_CACHE_SIZE:
+                        _knowledge_cache.popitem(last=False)
+                pending[query].set_result(value)
+        finally:
+            # Se o dono foi cancelado, quem aguarda assume e refaz a busca; o
+            # cancelamento de uma requisição nunca se propaga às demais
+            for query in owned:
+                future = _knowledge_inflight.pop(_knowledge_key(namespace, query, top_k))
+                if not future.done():
+                    future.set_result(_OWNER_CANCELLED)
+
+    for query, future in pending.items():
+        # shield: o cancelamento de quem aguarda não cancela o futuro compartilhado
+        result = await asyncio.shield(future)
+        if result is _OWNER_CANCELLED:
+            result = (await _search_matches([query], namespace, top_k, user_id))[0]
+        results[query] = result
+    return [results[query] for query in queries]
+
+async def search_knowledge(query: str, namespace: str, top_k: int = 10,
+                           user_id: str = "system") -> Dict[str, Any]:
+    """Busca uma consulta em um namespace"""
+    result = (await _search_matches([query], namespace, top_k, user_id))[0]
+    if isinstance(result, BaseException):
+        raise result
+    return {"success": True, "matches": result}
+
+async def search_knowledge_batch(queries: List[str], namespace: str, top_k: int = 10,
+                                 user_id: str = "system") -> Dict[str, Any]:
+    """Busca várias consultas em um namespace com uma única sessão e um único lote"""
+    results = await _search_matches(queries, namespace, top_k, user_id)
+    matches = []
+    failed_queries = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            failed_queries += 1
+        else:
+            matches.extend(result)
+    return {
+        "success": failed_queries < len(results),
+        "matches": matches,
+        "failed_queries": failed_queries
+    }
+
 # Exportar TODAS as ferramentas MCP
 MCP_TOOLS = {
     # Ferramentas individuais por namespace (17)
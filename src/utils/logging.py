@@ -4,12 +4,16 @@ Sistema crítico de aviação com logging para auditoria, debugging e compliance
 """
 
 import logging
+import logging.handlers
+import atexit
+import queue
 import json
 import uuid
 import re
 import time
+import threading
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 import os
 
@@ -23,6 +27,38 @@ except ImportError:
     cloud_logging = None
     error_reporting = None
 
+# orjson (opcional): serialização JSON em C para o formatador estruturado
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# pyahocorasick (opcional): autômato para palavras-chave de urgência
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Hyperscan (opcional): pré-filtro multi-padrão para o contexto de aviação
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+
+MESSAGE_PREVIEW_LENGTH = 100
+
+
+def message_preview(text: str, limit: int = MESSAGE_PREVIEW_LENGTH) -> str:
+    """Retorna prévia truncada do texto para logs"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class LogLevel(Enum):
     """Níveis de log específicos para aviação"""
@@ -71,50 +107,122 @@ class AviationContextExtractor:
         r'\b(\d{2}:\d{2}:\d{2}[NS])\s*(\d{3}:\d{2}:\d{2}[EW])\b',
     ]
     
+    # Padrões compilados uma única vez na importação
+    _ICAO_RES = tuple(re.compile(p) for p in ICAO_PATTERNS)
+    _AIRCRAFT_RES = tuple(re.compile(p) for p in AIRCRAFT_PATTERNS)
+    _REGULATION_RES = tuple(re.compile(p) for p in REGULATION_PATTERNS)
+    _FREQUENCY_RES = tuple(re.compile(p) for p in FREQUENCY_PATTERNS)
+    _COORDINATE_RES = tuple(re.compile(p) for p in COORDINATE_PATTERNS)
+    
+    @staticmethod
+    def _find_all(patterns, text_upper: str) -> List[str]:
+        """Aplica os padrões compilados e retorna matches sem duplicatas"""
+        found = set()
+        for pattern in patterns:
+            found.update(pattern.findall(text_upper))
+        return list(found)
+    
+    @classmethod
+    def _find_coordinates(cls, text_upper: str) -> List[str]:
+        found = set()
+        for pattern in cls._COORDINATE_RES:
+            found.update(f"{lat} {lon}" for lat, lon in pattern.findall(text_upper))
+        return list(found)
+    
     @classmethod
     def extract_icao_codes(cls, text: str) -> List[str]:
         """Extrai códigos ICAO do texto"""
-        codes = []
-        for pattern in cls.ICAO_PATTERNS:
-            matches = re.findall(pattern, text.upper())
-            codes.extend(matches)
-        return list(set(codes))  # Remove duplicatas
+        return cls._find_all(cls._ICAO_RES, text.upper())
     
     @classmethod
     def extract_aircraft_types(cls, text: str) -> List[str]:
         """Extrai tipos de aeronave do texto"""
-        types = []
-        for pattern in cls.AIRCRAFT_PATTERNS:
-            matches = re.findall(pattern, text.upper())
-            types.extend(matches)
-        return list(set(types))
+        return cls._find_all(cls._AIRCRAFT_RES, text.upper())
     
     @classmethod
     def extract_regulations(cls, text: str) -> List[str]:
         """Extrai referências regulatórias do texto"""
-        regulations = []
-        for pattern in cls.REGULATION_PATTERNS:
-            matches = re.findall(pattern, text.upper())
-            regulations.extend(matches)
-        return list(set(regulations))
+        return cls._find_all(cls._REGULATION_RES, text.upper())
     
     @classmethod
     def extract_frequencies(cls, text: str) -> List[str]:
         """Extrai frequências de rádio do texto"""
-        frequencies = []
-        for pattern in cls.FREQUENCY_PATTERNS:
-            matches = re.findall(pattern, text.upper())
-            frequencies.extend(matches)
-        return list(set(frequencies))
+        return cls._find_all(cls._FREQUENCY_RES, text.upper())
     
     @classmethod
     def extract_coordinates(cls, text: str) -> List[str]:
         """Extrai coordenadas geográficas do texto"""
-        coordinates = []
-        for pattern in cls.COORDINATE_PATTERNS:
-            matches = re.findall(pattern, text.upper())
-            coordinates.extend([f"{lat} {lon}" for lat, lon in matches])
-        return list(set(coordinates))
+        return cls._find_coordinates(text.upper())
+    
+    @classmethod
+    def _build_hyperscan_database(cls):
+        """Compila todos os padrões em um único banco Hyperscan (id = categoria)"""
+        categories = (
+            cls.ICAO_PATTERNS, cls.AIRCRAFT_PATTERNS, cls.REGULATION_PATTERNS,
+            cls.FREQUENCY_PATTERNS, cls.COORDINATE_PATTERNS,
+        )
+        expressions, ids = [], []
+        for category_id, patterns in enumerate(categories):
+            for pattern in patterns:
+                expressions.append(pattern.encode("utf-8"))
+                ids.append(category_id)
+        flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[flags] * len(expressions),
+        )
+        return database
+    
+    @classmethod
+    def _matched_categories(cls, text_upper: str) -> Optional[set]:
+        """Varre o texto uma única vez e retorna as categorias com algum match"""
+        # Hyperscan não suporta \b em modo Unicode: textos não-ASCII usam só o re
+        if cls._hs_database is None or not text_upper.isascii():
+            return None
+        scratch = getattr(cls._hs_local, "scratch", None)
+        if scratch is None:
+            scratch = cls._hs_local.scratch = hyperscan.Scratch(cls._hs_database)
+        matched = set()
+        
+        def on_match(category_id, start, end, flags, context):
+            matched.add(category_id)
+        
+        cls._hs_database.scan(
+            text_upper.encode("ascii"), match_event_handler=on_match, scratch=scratch
+        )
+        return matched
+    
+    @classmethod
+    def extract_all(cls, text: str) -> Dict[str, List[str]]:
+        """Extrai todo o contexto de aviação convertendo o texto uma única vez"""
+        text_upper = text.upper()
+        matched = cls._matched_categories(text_upper)
+        
+        def scan(category_id, patterns):
+            if matched is not None and category_id not in matched:
+                return []
+            return cls._find_all(patterns, text_upper)
+        
+        return {
+            "icao_codes": scan(0, cls._ICAO_RES),
+            "aircraft_types": scan(1, cls._AIRCRAFT_RES),
+            "regulations": scan(2, cls._REGULATION_RES),
+            "frequencies": scan(3, cls._FREQUENCY_RES),
+            "coordinates": (
+                cls._find_coordinates(text_upper)
+                if matched is None or 4 in matched else []
+            ),
+        }
+
+
+# Banco Hyperscan compilado na importação; scratch é por thread
+AviationContextExtractor._hs_database = (
+    AviationContextExtractor._build_hyperscan_database() if HYPERSCAN_AVAILABLE else None
+)
+AviationContextExtractor._hs_local = threading.local()
 
 
 class UrgencyClassifier:
@@ -134,37 +242,62 @@ class UrgencyClassifier:
         "microburst", "microexplosão", "thunderstorm", "tempestade"
     ]
     
+    # Fallback sem pyahocorasick: uma alternação compilada por nível
+    _EMERGENCY_RE = re.compile('|'.join(map(re.escape, EMERGENCY_KEYWORDS)))
+    _PRIORITY_RE = re.compile('|'.join(map(re.escape, PRIORITY_KEYWORDS)))
+    
     @classmethod
-    def classify_urgency(cls, message: str, agent_classification: str = None) -> UrgencyLevel:
-        """Classifica o nível de urgência da mensagem"""
-        message_lower = message.lower()
-        
-        # Verificar palavras-chave de emergência
-        if any(keyword in message_lower for keyword in cls.EMERGENCY_KEYWORDS):
+    def _build_automaton(cls):
+        """Monta o autômato Aho-Corasick com o nível de cada palavra-chave"""
+        automaton = ahocorasick.Automaton()
+        for keyword in cls.PRIORITY_KEYWORDS:
+            automaton.add_word(keyword, UrgencyLevel.PRIORITY)
+        for keyword in cls.EMERGENCY_KEYWORDS:
+            automaton.add_word(keyword, UrgencyLevel.EMERGENCY)
+        automaton.make_automaton()
+        return automaton
+    
+    @classmethod
+    def _scan(cls, text_lower: str) -> Optional[UrgencyLevel]:
+        """Retorna o maior nível encontrado no texto (None se nenhum)"""
+        if cls._automaton is not None:
+            found = None
+            for _, level in cls._automaton.iter(text_lower):
+                if level is UrgencyLevel.EMERGENCY:
+                    return level
+                found = level
+            return found
+        
+        if cls._EMERGENCY_RE.search(text_lower):
             return UrgencyLevel.EMERGENCY
-        
-        # Verificar palavras-chave de prioridade
-        if any(keyword in message_lower for keyword in cls.PRIORITY_KEYWORDS):
+        if cls._PRIORITY_RE.search(text_lower):
             return UrgencyLevel.PRIORITY
-        
-        # Verificar classificação do agente
-        if agent_classification:
-            agent_lower = agent_classification.lower()
-            if any(keyword in agent_lower for keyword in cls.EMERGENCY_KEYWORDS):
-                return UrgencyLevel.EMERGENCY
-            if any(keyword in agent_lower for keyword in cls.PRIORITY_KEYWORDS):
-                return UrgencyLevel.PRIORITY
-        
-        return UrgencyLevel.ROUTINE
+        return None
+    
+    @classmethod
+    def classify_urgency(cls, message: str, agent_classification: str = None) -> UrgencyLevel:
+        """Classifica o nível de urgência da mensagem"""
+        # Palavras-chave da mensagem têm precedência sobre a classificação do agente
+        level = cls._scan(message.lower())
+        if level is None and agent_classification:
+            level = cls._scan(agent_classification.lower())
+        return level or UrgencyLevel.ROUTINE
+
+
+UrgencyClassifier._automaton = (
+    UrgencyClassifier._build_automaton() if AHOCORASICK_AVAILABLE else None
+)
 
 
 class StructuredJSONFormatter(logging.Formatter):
     """Formatador JSON estruturado para logs"""
     
+    OPTIONAL_FIELDS = ('aviation_context', 'user_id', 'agent_name', 'urgency_level')
+    
     def format(self, record):
         """Formata o registro de log em JSON estruturado"""
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "log_type": getattr(record, 'log_type', 'GENERAL'),
             "trace_id": getattr(record, 'trace_id', 'unknown'),
@@ -176,20 +309,57 @@ class StructuredJSONFormatter(logging.Formatter):
             "thread_id": record.thread,
         }
         
-        # Adicionar contexto adicional se disponível
-        if hasattr(record, 'aviation_context'):
-            log_entry['aviation_context'] = record.aviation_context
-        
-        if hasattr(record, 'user_id'):
-            log_entry['user_id'] = record.user_id
-        
-        if hasattr(record, 'agent_name'):
-            log_entry['agent_name'] = record.agent_name
+        # Adicionar contexto adicional se disponível (lookup direto no __dict__ do registro)
+        record_dict = record.__dict__
+        for field in self.OPTIONAL_FIELDS:
+            if field in record_dict:
+                log_entry[field] = record_dict[field]
         
-        if hasattr(record, 'urgency_level'):
-            log_entry['urgency_level'] = record.urgency_level
-        
-        return json.dumps(log_entry, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+class BatchedFileHandler(logging.FileHandler):
+    """FileHandler cujo flush é adiado até a fila de logs esvaziar"""
+    
+    # Buffer fixo do arquivo, reutilizado durante toda a vida do handler
+    BUFFER_SIZE = 64 * 1024
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self):
+        """Flush adiado: executado pelo listener ao fim de cada rajada"""
+    
+    def flush_batch(self):
+        """Descarrega no disco todos os registros escritos desde o último lote"""
+        super().flush()
+    
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener que agrupa as escritas em disco por rajada de registros"""
+    
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._flush_batched_handlers()
+            return self.queue.get(block)
+    
+    def stop(self):
+        super().stop()
+        self._flush_batched_handlers()
+    
+    def _flush_batched_handlers(self):
+        for handler in self.handlers:
+            if isinstance(handler, BatchedFileHandler):
+                handler.flush_batch()
 
 
 class StratusLogger:
@@ -229,27 +399,40 @@ class StratusLogger:
     
     def _setup_structured_logging(self):
         """Configura logging estruturado"""
+        global _queue_listener
         self.logger = logging.getLogger("stratus_ia")
-        self.logger.setLevel(logging.DEBUG)
+        level = logging.getLevelName(os.getenv('LOG_LEVEL', 'DEBUG').upper())
+        self.logger.setLevel(level if isinstance(level, int) else logging.DEBUG)
         
-        # Limpar handlers existentes
+        # Limpar handlers existentes (e parar listener anterior)
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
         
         # Handler para console com formatação JSON
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(StructuredJSONFormatter())
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # Handler para arquivo em produção
         if self.environment == "production":
-            file_handler = logging.FileHandler(f"logs/stratus_ia_{datetime.now().strftime('%Y%m%d')}.log")
+            file_handler = BatchedFileHandler(f"logs/stratus_ia_{datetime.now().strftime('%Y%m%d')}.log")
             file_handler.setFormatter(StructuredJSONFormatter())
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # O event loop apenas enfileira; formatação e escrita ocorrem em thread dedicada
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
     
-    def _log_with_performance_tracking(self, level: str, message: str, **kwargs):
-        """Log com tracking de performance"""
-        start_time = time.time()
+    def _log_with_performance_tracking(self, level: str, message: str, *args, **kwargs):
+        """Log com tracking de performance (args formatados com % apenas se o nível estiver ativo)"""
+        if not self.logger.isEnabledFor(self._LEVELS.get(level, logging.DEBUG)):
+            return
+        start_ns = time.perf_counter_ns()
         
         # Adicionar trace_id e contexto aos kwargs
         kwargs['trace_id'] = self.trace_id
@@ -257,18 +440,18 @@ class StratusLogger:
         
         # Registrar log
         if level == 'INFO':
-            self.logger.info(message, extra=kwargs)
+            self.logger.info(message, *args, extra=kwargs)
         elif level == 'ERROR':
-            self.logger.error(message, extra=kwargs)
+            self.logger.error(message, *args, extra=kwargs)
         elif level == 'CRITICAL':
-            self.logger.critical(message, extra=kwargs)
+            self.logger.critical(message, *args, extra=kwargs)
         elif level == 'WARNING':
-            self.logger.warning(message, extra=kwargs)
+            self.logger.warning(message, *args, extra=kwargs)
         else:
-            self.logger.debug(message, extra=kwargs)
+            self.logger.debug(message, *args, extra=kwargs)
         
         # Atualizar métricas
-        duration = (time.time() - start_time) * 1000  # em ms
+        duration = (time.perf_counter_ns() - start_ns) / 1e6  # em ms
         self.log_count += 1
         self.total_log_time += duration
         
@@ -277,36 +460,44 @@ class StratusLogger:
             self._log_warning(f"Log lento detectado: {duration:.2f}ms", 
                             log_type=LogLevel.PERFORMANCE.value)
     
-    def _log_info(self, message: str, **kwargs):
+    _LEVELS = {
+        'INFO': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR,
+        'CRITICAL': logging.CRITICAL,
+    }
+    
+    def _log_info(self, message: str, *args, **kwargs):
         """Log de informação"""
-        self._log_with_performance_tracking('INFO', message, **kwargs)
+        self._log_with_performance_tracking('INFO', message, *args, **kwargs)
     
-    def _log_warning(self, message: str, **kwargs):
+    def _log_warning(self, message: str, *args, **kwargs):
         """Log de aviso"""
-        self._log_with_performance_tracking('WARNING', message, **kwargs)
+        self._log_with_performance_tracking('WARNING', message, *args, **kwargs)
     
-    def _log_error(self, message: str, **kwargs):
+    def _log_error(self, message: str, *args, **kwargs):
         """Log de erro"""
-        self._log_with_performance_tracking('ERROR', message, **kwargs)
+        self._log_with_performance_tracking('ERROR', message, *args, **kwargs)
     
-    def _log_critical(self, message: str, **kwargs):
+    def _log_critical(self, message: str, *args, **kwargs):
         """Log crítico"""
-        self._log_with_performance_tracking('CRITICAL', message, **kwargs)
+        self._log_with_performance_tracking('CRITICAL', message, *args, **kwargs)
     
     def extract_aviation_context(self, message: str) -> Dict[str, Any]:
         """Extrai contexto específico de aviação da mensagem"""
-        return {
-            "icao_codes": AviationContextExtractor.extract_icao_codes(message),
-            "aircraft_types": AviationContextExtractor.extract_aircraft_types(message),
-            "regulations": AviationContextExtractor.extract_regulations(message),
-            "frequencies": AviationContextExtractor.extract_frequencies(message),
-            "coordinates": AviationContextExtractor.extract_coordinates(message),
-        }
+        return AviationContextExtractor.extract_all(message)
     
     def determine_urgency(self, message: str, agent_classification: str = None) -> UrgencyLevel:
         """Determina nível de urgência baseado no conteúdo da mensagem"""
         return UrgencyClassifier.classify_urgency(message, agent_classification)
     
+    def analyze(self, message: str, agent_classification: str = None) -> Tuple[Dict[str, Any], UrgencyLevel]:
+        """Extrai contexto de aviação e urgência da mensagem em uma única chamada"""
+        return (
+            AviationContextExtractor.extract_all(message),
+            UrgencyClassifier.classify_urgency(message, agent_classification),
+        )
+    
     def log_agent_action(self, 
                         agent_name: str,
                         action: str,
@@ -314,18 +505,22 @@ class StratusLogger:
                         user_id: str,
                         duration_ms: float = None,
                         success: bool = True,
-                        additional_context: Dict[str, Any] = None):
-        """Log de ações de agentes com contexto de aviação"""
+                        additional_context: Dict[str, Any] = None,
+                        message_args: tuple = ()):
+        """Log de ações de agentes com contexto de aviação (message formatada com % apenas se o nível estiver ativo)"""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
         
-        aviation_context = self.extract_aviation_context(message)
-        urgency = self.determine_urgency(message)
+        if message_args:
+            message = message % message_args
+        aviation_context, urgency = self.analyze(message)
         
         log_data = {
             "log_type": LogLevel.AGENT_ACTION.value,
             "agent_name": agent_name,
             "action": action,
             "user_id": user_id,
-            "message_preview": message[:100] + "..." if len(message) > 100 else message,
+            "message_preview": message_preview(message),
             "urgency_level": urgency.value,
             "aviation_context": aviation_context,
             "duration_ms": duration_ms,
@@ -347,7 +542,20 @@ class StratusLogger:
                            user_id: str,
                            severity: str = "HIGH"):
         """Log de violações de segurança - CRÍTICO para aviação"""
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._emit_safety_violation(violation_type, message, agent_name, user_id, severity)
         
+        # Enviar para Google Cloud Error Reporting se em produção
+        if (self.environment == "production" and 
+            self.error_client and 
+            severity in ["HIGH", "CRITICAL"]):
+            try:
+                self.error_client.report_exception()
+            except Exception as e:
+                self._log_error(f"Falha ao reportar erro para Google Cloud: {e}")
+    
+    def _emit_safety_violation(self, violation_type: str, message: str, agent_name: str,
+                               user_id: str, severity: str):
         log_data = {
             "log_type": LogLevel.SAFETY_CRITICAL.value,
             "violation_type": violation_type,
@@ -359,15 +567,6 @@ class StratusLogger:
         }
         
         self._log_critical(f"VIOLAÇÃO DE SEGURANÇA: {violation_type} - {message}", **log_data)
-        
-        # Enviar para Google Cloud Error Reporting se em produção
-        if (self.environment == "production" and 
-            self.error_client and 
-            severity in ["HIGH", "CRITICAL"]):
-            try:
-                self.error_client.report_exception()
-            except Exception as e:
-                self._log_error(f"Falha ao reportar erro para Google Cloud: {e}")
     
     def log_api_call(self,
                     api_name: str,
@@ -379,6 +578,8 @@ class StratusLogger:
                     cache_hit: bool = False,
                     error_message: str = None):
         """Log de chamadas para APIs e MCPs"""
+        if not self.logger.isEnabledFor(logging.ERROR if status_code >= 400 else logging.INFO):
+            return
         
         log_data = {
             "log_type": LogLevel.API_CALL.value,
@@ -407,6 +608,9 @@ class StratusLogger:
                              user_id: str = None,
                              threshold: float = None):
         """Log de métricas de performance para monitoramento"""
+        exceeded = bool(threshold and value > threshold)
+        if not self.logger.isEnabledFor(logging.WARNING if exceeded else logging.INFO):
+            return
         
         log_data = {
             "log_type": LogLevel.PERFORMANCE.value,
@@ -417,7 +621,7 @@ class StratusLogger:
             "user_id": user_id,
         }
         
-        if threshold and value > threshold:
+        if exceeded:
             log_data["threshold_exceeded"] = True
             self._log_warning(f"Métrica {metric_name} excedeu threshold", **log_data)
         else:
@@ -431,6 +635,14 @@ class StratusLogger:
                                 user_id: str,
                                 details: Dict[str, Any] = None):
         """Log de compliance regulatório"""
+        if compliance_status == "VIOLATION":
+            level = logging.CRITICAL
+        elif compliance_status == "WARNING":
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
         
         log_data = {
             "log_type": LogLevel.REGULATORY.value,
@@ -458,15 +670,18 @@ class StratusLogger:
                            session_id: str = None,
                            response_time_ms: float = None):
         """Log de interações do usuário"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
+        aviation_context, urgency = self.analyze(message)
         log_data = {
             "log_type": LogLevel.USER_INTERACTION.value,
             "interaction_type": interaction_type,
             "user_id": user_id,
             "session_id": session_id,
             "response_time_ms": response_time_ms,
-            "aviation_context": self.extract_aviation_context(message),
-            "urgency_level": self.determine_urgency(message).value,
+            "aviation_context": aviation_context,
+            "urgency_level": urgency.value,
         }
         
         self._log_info(f"Interação do usuário: {interaction_type}", **log_data)
@@ -491,6 +706,16 @@ class StratusLogger:
 # Instância global do logger
 _stratus_logger = None
 
+# Listener que escreve os registros enfileirados nos handlers reais
+_queue_listener = None
+
+
+@atexit.register
+def _stop_queue_listener():
+    """Esvazia a fila de logs ao encerrar o processo"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
 
 def get_logger() -> StratusLogger:
     """Retorna instância global do Stratus logger"""
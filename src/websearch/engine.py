@@ -6,6 +6,7 @@ Motor de busca inteligente especializado para aviação civil
 import asyncio
 import hashlib
 import re
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from urllib.parse import urlparse
@@ -110,6 +111,30 @@ Runner = MockRunner
 
 class StratusWebSearchEngine:
     """Motor de busca inteligente para aviação"""
+
+    # Tabelas estáticas de classificação, montadas uma única vez
+    DOMAIN_KEYWORDS = {
+        SearchDomain.METEOROLOGY: ("metar", "taf", "tempo", "meteorologia", "vento", "visibilidade"),
+        SearchDomain.NOTAMS: ("notam", "aviso", "restrição", "fechamento", "obras"),
+        SearchDomain.REGULATIONS: ("rbac", "regulamento", "norma", "instrução", "portaria"),
+        SearchDomain.AIRPORTS: ("aeroporto", "pista", "icao", "sbgr", "sbsp", "sbrj"),
+        SearchDomain.EMERGENCY: ("emergência", "socorro", "mayday", "pan pan", "falha"),
+    }
+    STOP_WORDS = frozenset({
+        "o", "a", "os", "as", "de", "da", "do", "das", "dos", "em", "na", "no",
+        "para", "por", "com", "como", "que", "qual", "onde", "quando", "por que"
+    })
+    AVIATION_TERMS = ("aviação", "aeronáutica", "voo", "piloto")
+    EMERGENCY_KEYWORDS = ("emergência", "mayday", "pan pan", "socorro", "falha")
+    CRITICAL_KEYWORDS = ("notam", "metar", "taf", "fechamento", "restrição")
+    AUTHORITY_SCORES = {
+        SourceReliability.OFFICIAL: 1.0,
+        SourceReliability.VERIFIED: 0.8,
+        SourceReliability.RELIABLE: 0.6,
+        SourceReliability.QUESTIONABLE: 0.4,
+        SourceReliability.UNRELIABLE: 0.2,
+    }
+
     def __init__(self):
         self.logger = get_logger()
         self.metrics = SearchMetrics()
@@ -154,7 +179,7 @@ class StratusWebSearchEngine:
             if not force_fresh:
                 cached_results = self._get_cached_results(processed_query.processed_query)
                 if cached_results:
-                    self.logger._log_info(f"Cache hit para query: {query}")
+                    self.logger._log_info("Cache hit para query: %s", query)
                     self.metrics.cache_hit_rate = self._update_cache_hit_rate(True)
                     return cached_results
             
@@ -175,7 +200,9 @@ class StratusWebSearchEngine:
             self._update_metrics(True, execution_time, len(sorted_results))
             
             self.logger._log_info(
-                f"Busca concluída: {len(sorted_results)} resultados em {execution_time:.2f}s",
+                "Busca concluída: %d resultados em %.2fs",
+                len(sorted_results),
+                execution_time,
                 query=query,
                 domain=processed_query.domain.value,
                 results_count=len(sorted_results)
@@ -217,18 +244,9 @@ class StratusWebSearchEngine:
         """Detecta automaticamente o domínio da busca"""
         query_lower = query.lower()
         
-        # Palavras-chave por domínio
-        domain_keywords = {
-            SearchDomain.METEOROLOGY: ["metar", "taf", "tempo", "meteorologia", "vento", "visibilidade"],
-            SearchDomain.NOTAMS: ["notam", "aviso", "restrição", "fechamento", "obras"],
-            SearchDomain.REGULATIONS: ["rbac", "regulamento", "norma", "instrução", "portaria"],
-            SearchDomain.AIRPORTS: ["aeroporto", "pista", "icao", "sbgr", "sbsp", "sbrj"],
-            SearchDomain.EMERGENCY: ["emergência", "socorro", "mayday", "pan pan", "falha"],
-        }
-        
         # Conta matches por domínio
         domain_scores = {}
-        for domain, keywords in domain_keywords.items():
+        for domain, keywords in self.DOMAIN_KEYWORDS.items():
             score = sum(1 for kw in keywords if kw in query_lower)
             if score > 0:
                 domain_scores[domain] = score
@@ -241,15 +259,9 @@ class StratusWebSearchEngine:
     
     def _extract_keywords(self, query: str) -> List[str]:
         """Extrai palavras-chave relevantes"""
-        # Remove stop words comuns
-        stop_words = {
-            "o", "a", "os", "as", "de", "da", "do", "das", "dos", "em", "na", "no",
-            "para", "por", "com", "como", "que", "qual", "onde", "quando", "por que"
-        }
-        
-        # Extrai palavras (mantém códigos ICAO e técnicos)
+        # Extrai palavras (mantém códigos ICAO e técnicos), sem stop words comuns
         words = re.findall(r'\b[A-Z]{4}\b|\b\w{3,}\b', query.upper())
-        keywords = [w.lower() for w in words if w.lower() not in stop_words]
+        keywords = [w for w in map(str.lower, words) if w not in self.STOP_WORDS]
         
         return list(set(keywords))  # Remove duplicatas
     
@@ -265,8 +277,8 @@ class StratusWebSearchEngine:
             optimized = query
         
         # Adiciona termos de aviação se não presentes
-        aviation_terms = ["aviação", "aeronáutica", "voo", "piloto"]
-        if not any(term in query.lower() for term in aviation_terms):
+        query_lower = query.lower()
+        if not any(term in query_lower for term in self.AVIATION_TERMS):
             optimized += " aviação"
         
         return optimized
@@ -274,15 +286,14 @@ class StratusWebSearchEngine:
     def _calculate_priority(self, query: str, keywords: List[str]) -> int:
         """Calcula prioridade da busca (1-10)"""
         priority = 5  # Prioridade base
+        query_lower = query.lower()
         
         # Aumenta prioridade para emergências
-        emergency_keywords = ["emergência", "mayday", "pan pan", "socorro", "falha"]
-        if any(kw in query.lower() for kw in emergency_keywords):
+        if any(kw in query_lower for kw in self.EMERGENCY_KEYWORDS):
             priority = 10
         
         # Aumenta para informações críticas
-        critical_keywords = ["notam", "metar", "taf", "fechamento", "restrição"]
-        if any(kw in query.lower() for kw in critical_keywords):
+        if any(kw in query_lower for kw in self.CRITICAL_KEYWORDS):
             priority = min(priority + 3, 10)
         
         # Aumenta para códigos ICAO específicos
@@ -435,15 +446,7 @@ class StratusWebSearchEngine:
     
     def _calculate_authority_score(self, result: Dict[str, Any], reliability: SourceReliability) -> float:
         """Calcula score de autoridade"""
-        base_scores = {
-            SourceReliability.OFFICIAL: 1.0,
-            SourceReliability.VERIFIED: 0.8,
-            SourceReliability.RELIABLE: 0.6,
-            SourceReliability.QUESTIONABLE: 0.4,
-            SourceReliability.UNRELIABLE: 0.2,
-        }
-        
-        return base_scores.get(reliability, 0.5)
+        return self.AUTHORITY_SCORES.get(reliability, 0.5)
     
     async def _extract_structured_data(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai dados estruturados do resultado"""
@@ -454,14 +457,16 @@ class StratusWebSearchEngine:
         text = title + " " + snippet
         
         # Extrai códigos ICAO
+        # Tokens recorrentes entre resultados são internados: cada código
+        # ICAO/horário repetido passa a ser um único objeto compartilhado
         icao_codes = re.findall(r'\b[A-Z]{4}\b', text.upper())
         if icao_codes:
-            extracted['icao_codes'] = icao_codes
+            extracted['icao_codes'] = [sys.intern(code) for code in icao_codes]
         
         # Extrai horários (formato HHMM)
         times = re.findall(r'\b\d{4}Z?\b', text)
         if times:
-            extracted['times'] = times
+            extracted['times'] = [sys.intern(time) for time in times]
         
         # Extrai coordenadas se presentes
         coords = re.findall(r'\d{1,2}°\d{1,2}\'[NS]\s+\d{1,3}°\d{1,2}\'[EW]', text)
@@ -6,13 +6,21 @@ Responsável por extrair e processar conteúdo de páginas web relacionadas à a
 import asyncio
 import hashlib
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from urllib.parse import urlparse, urljoin
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
 from pydantic import BaseModel, Field
 
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+
 from .base import (
     ContentType, 
     SourceReliability, 
@@ -40,7 +48,7 @@ class ScrapingConfig(BaseModel):
     timeout: int = Field(default=30, description="Timeout em segundos")
     max_retries: int = Field(default=3, description="Máximo de tentativas")
     rate_limit_delay: float = Field(default=1.0, description="Delay entre requisições em segundos")
-    max_content_length: int = Field(default=100000, description="Tamanho máximo do conteúdo")
+    max_content_length: int = Field(default=100000, description="Tamanho máximo do conteúdo (bytes)")
     user_agent: str = Field(
         default="Stratus.IA/1.0 (Aviation Content Scraper)",
         description="User-Agent para requisições"
@@ -54,6 +62,12 @@ class ScrapingConfig(BaseModel):
 class StratusContentScraper:
     """Scraper especializado para conteúdo de aviação"""
     
+    # Tamanho dos blocos lidos do corpo das respostas HTTP
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # Máximo de extrações estruturadas memorizadas por conteúdo
+    EXTRACTION_CACHE_SIZE = 1024
+    
     def __init__(self, config: Optional[ScrapingConfig] = None):
         self.config = config or ScrapingConfig()
         self.logger = get_logger()
@@ -62,8 +76,16 @@ class StratusContentScraper:
         # Cache de conteúdo
         self.content_cache: Dict[str, Dict[str, Any]] = {}
         
-        # Rate limiting
-        self.last_request_time = datetime.now()
+        # Cache LRU de dados estruturados, indexado pela impressão digital do conteúdo
+        self.extraction_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        
+        # Rate limiting por token bucket: requisições concorrentes dividem a
+        # mesma cota em vez de dormirem todas o mesmo intervalo
+        if AIOLIMITER_AVAILABLE:
+            self.rate_limiter = AsyncLimiter(1, self.config.rate_limit_delay)
+        else:
+            self.rate_limiter = None
+        self.next_request_time = 0.0
         
         # Headers para requisições
         self.headers = {
@@ -216,14 +238,28 @@ class StratusContentScraper:
                 ) as session:
                     async with session.get(url) as response:
                         if response.status == 200:
-                            content = await response.text()
+                            # Lê o corpo em blocos e para no limite configurado,
+                            # sem bufferizar páginas grandes por inteiro
+                            chunks = []
+                            remaining = self.config.max_content_length
+                            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                                if len(chunk) >= remaining:
+                                    chunks.append(chunk[:remaining])
+                                    self.logger._log_warning(
+                                        f"Conteúdo muito grande: truncado em {self.config.max_content_length} bytes"
+                                    )
+                                    break
+                                chunks.append(chunk)
+                                remaining -= len(chunk)
                             
-                            # Verifica tamanho do conteúdo
-                            if len(content) > self.config.max_content_length:
-                                self.logger._log_warning(f"Conteúdo muito grande: {len(content)} caracteres")
-                                content = content[:self.config.max_content_length]
-                            
-                            return content
+                            body = b"".join(chunks)
+                            try:
+                                encoding = response.get_encoding()
+                            except RuntimeError:
+                                # Sem charset no Content-Type (corpo lido em blocos):
+                                # detecta pelo próprio HTML, como o <meta charset>
+                                encoding = UnicodeDammit(body, is_html=True).original_encoding or "utf-8"
+                            return body.decode(encoding, errors="replace")
                         else:
                             self.logger._log_warning(f"HTTP {response.status} para {url}")
                             
@@ -240,14 +276,17 @@ class StratusContentScraper:
     
     async def _rate_limit(self):
         """Implementa rate limiting"""
-        now = datetime.now()
-        time_since_last = (now - self.last_request_time).total_seconds()
-        
-        if time_since_last < self.config.rate_limit_delay:
-            delay = self.config.rate_limit_delay - time_since_last
-            await asyncio.sleep(delay)
-        
-        self.last_request_time = datetime.now()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+            return
+        
+        # Sem aiolimiter: cada chamada reserva o próximo horário livre antes de
+        # aguardar, espaçando corretamente chamadas concorrentes
+        now = time.monotonic()
+        slot = max(now, self.next_request_time)
+        self.next_request_time = slot + self.config.rate_limit_delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extrai título da página"""
@@ -373,6 +412,16 @@ class StratusContentScraper:
     
     def _extract_structured_data(self, content: str, content_type: ContentType) -> Dict[str, Any]:
         """Extrai dados estruturados baseado no tipo de conteúdo"""
+        # Páginas idênticas (mesmo conteúdo em URLs diferentes ou recarregadas
+        # após expirar o cache) reaproveitam a extração anterior
+        fingerprint = hashlib.blake2b(
+            f"{content_type.value}\0{content}".encode(), digest_size=16
+        ).digest()
+        cached = self.extraction_cache.get(fingerprint)
+        if cached is not None:
+            self.extraction_cache.move_to_end(fingerprint)
+            return dict(cached)
+        
         structured_data = {}
         
         if content_type in self.extraction_patterns:
@@ -398,7 +447,11 @@ class StratusContentScraper:
             if matches:
                 structured_data[data_type] = matches
         
-        return structured_data
+        self.extraction_cache[fingerprint] = structured_data
+        if len(self.extraction_cache) > self.EXTRACTION_CACHE_SIZE:
+            self.extraction_cache.popitem(last=False)
+        
+        return dict(structured_data)
     
     def _get_cached_content(self, url: str) -> Optional[ScrapedContent]:
         """Recupera conteúdo do cache"""
@@ -498,4 +551,5 @@ class StratusContentScraper:
     def clear_cache(self):
         """Limpa o cache de conteúdo"""
         self.content_cache.clear()
+        self.extraction_cache.clear()
         self.logger._log_info("Cache de conteúdo limpo") 
\ No newline at end of file
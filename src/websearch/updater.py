@@ -8,7 +8,7 @@ import hashlib
 import json
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Set, Union
 from urllib.parse import urlparse
 from pydantic import BaseModel, Field
 
@@ -63,6 +63,9 @@ class StratusKnowledgeUpdater:
         # Histórico de atualizações
         self.update_history: List[KnowledgeUpdate] = []
         
+        # Hashes já presentes no histórico, para deduplicação em O(1)
+        self.history_hashes: Set[str] = set()
+        
         # Mapeamento de tipos de conteúdo para prioridades
         self.content_priorities = {
             ContentType.EMERGENCY: 10,
@@ -111,23 +114,25 @@ class StratusKnowledgeUpdater:
         force_update: bool = False
     ) -> List[KnowledgeUpdate]:
         """Processa resultados de busca para atualização de conhecimento"""
-        updates = []
+        # Verifica quais resultados precisam de atualização
+        candidates = [
+            result for result in results
+            if force_update or self._needs_update(result)
+        ]
+        
+        # Cria atualizações em lote e classifica erros numa única passagem
+        outcomes = await asyncio.gather(
+            *(self._create_knowledge_update(result) for result in candidates),
+            return_exceptions=True
+        )
         
-        for result in results:
-            try:
-                # Verifica se precisa atualizar
-                if not force_update and not self._needs_update(result):
-                    continue
-                
-                # Cria atualização de conhecimento
-                update = await self._create_knowledge_update(result)
-                if update:
-                    updates.append(update)
-                    self.pending_updates.append(update)
-                
-            except Exception as e:
-                self.logger._log_error(f"Erro ao processar resultado: {str(e)}")
-                continue
+        updates = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                self.logger._log_error(f"Erro ao processar resultado: {str(outcome)}")
+            elif outcome:
+                updates.append(outcome)
+        self.pending_updates.extend(updates)
         
         # Ordena por prioridade
         updates.sort(key=lambda x: x.priority, reverse=True)
@@ -167,13 +172,26 @@ class StratusKnowledgeUpdater:
             if isinstance(result, KnowledgeUpdate):
                 successful_updates.append(result)
                 self.update_history.append(result)
+                self.history_hashes.add(result.content_hash)
             elif isinstance(result, Exception):
                 self.logger._log_error(f"Erro na atualização: {str(result)}")
         
         # Atualiza métricas
         self._update_metrics(len(successful_updates), len(updates))
         
-        self.logger._log_info(f"Executadas {len(successful_updates)} atualizações de conhecimento")
+        # Um único registro agregado por lote em vez de um log por etapa/atualização
+        self.logger._log_info(
+            f"Executadas {len(successful_updates)} atualizações de conhecimento",
+            updates=[
+                {
+                    "update_id": update.id,
+                    "content_type": update.content_type.value,
+                    "priority": update.priority,
+                    "status": update.status.value
+                }
+                for update in successful_updates
+            ]
+        )
         return successful_updates
     
     async def _create_knowledge_update(self, result: SearchResult) -> Optional[KnowledgeUpdate]:
@@ -209,8 +227,6 @@ class StratusKnowledgeUpdater:
     
     async def _execute_single_update(self, update: KnowledgeUpdate) -> KnowledgeUpdate:
         """Executa uma única atualização"""
-        start_time = datetime.now()
-        
         try:
             # Atualiza status
             update.status = UpdateStatus.PROCESSING
@@ -233,16 +249,6 @@ class StratusKnowledgeUpdater:
             # Atualiza cache
             self._cache_update(update)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.logger._log_info(
-                f"Atualização concluída: {update.id} em {execution_time:.2f}s",
-                extra={
-                    "update_id": update.id,
-                    "content_type": update.content_type.value,
-                    "priority": update.priority
-                }
-            )
-            
             return update
             
         except Exception as e:
@@ -368,8 +374,6 @@ class StratusKnowledgeUpdater:
         """Atualiza conhecimento no Pinecone"""
         # Implementação da integração com Pinecone
         # Em produção, incluiria upsert de vetores e metadados
-        self.logger._log_info(f"Atualizando Pinecone para: {update.id}")
-        
         # Simula atualização
         await asyncio.sleep(0.1)
     
@@ -377,8 +381,6 @@ class StratusKnowledgeUpdater:
         """Atualiza embeddings"""
         # Implementação da atualização de embeddings
         # Em produção, incluiria geração de novos embeddings
-        self.logger._log_info(f"Atualizando embeddings para: {update.id}")
-        
         # Simula atualização
         await asyncio.sleep(0.1)
     
@@ -399,11 +401,7 @@ class StratusKnowledgeUpdater:
             return True
         
         # Verifica histórico
-        for update in self.update_history:
-            if update.content_hash == content_hash:
-                return True
-        
-        return False
+        return content_hash in self.history_hashes
     
     def _cache_update(self, update: KnowledgeUpdate):
         """Armazena atualização no cache"""
@@ -453,4 +451,5 @@ class StratusKnowledgeUpdater:
     def clear_history(self):
         """Limpa o histórico de atualizações"""
         self.update_history.clear()
+        self.history_hashes.clear()
         self.logger._log_info("Histórico de atualizações limpo") 
\ No newline at end of file
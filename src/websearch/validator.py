@@ -3,8 +3,10 @@ Search Result Validator para Stratus.IA
 Responsável por validar e filtrar resultados de busca para garantir qualidade e confiabilidade
 """
 
+import asyncio
 import re
 import hashlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
@@ -55,8 +57,11 @@ class StratusSearchValidator:
         self.logger = get_logger()
         self.metrics = ValidationMetrics()
         
-        # Cache de validação
-        self.validation_cache: Dict[str, Dict[str, Any]] = {}
+        # Cache LRU de validação
+        self.validation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.cache_max_size = 1000
+        self.cache_hits = 0
+        self.cache_misses = 0
         
         # Cache de conteúdo para detecção de duplicatas
         self.content_hashes: Dict[str, str] = {}
@@ -110,8 +115,7 @@ class StratusSearchValidator:
             cache_key = self._generate_cache_key(result)
             cached_validation = self._get_cached_validation(cache_key)
             if cached_validation:
-                self.logger._log_info(f"Cache hit para validação: {result.url}")
-                self.metrics.cache_hit_rate = self._update_cache_hit_rate(True)
+                self.logger._log_info("Cache hit para validação: %s", result.url)
                 return cached_validation
             
             # Inicializa resultado de validação
@@ -142,7 +146,8 @@ class StratusSearchValidator:
             self._update_metrics(True, execution_time, validation_result.is_valid)
             
             self.logger._log_info(
-                f"Resultado validado: {result.title[:50]}...",
+                "Resultado validado: %.50s...",
+                result.title,
                 url=result.url,
                 title=result.title
             )
@@ -169,11 +174,10 @@ class StratusSearchValidator:
         filter_invalid: bool = True
     ) -> List[ValidationResult]:
         """Valida múltiplos resultados de busca"""
-        validation_results = []
-        
-        for result in results:
-            validation_result = await self.validate_result(result)
-            validation_results.append(validation_result)
+        # Valida em lote: uma única junção em vez de um await por resultado
+        validation_results = list(await asyncio.gather(
+            *(self.validate_result(result) for result in results)
+        ))
         
         # Filtra resultados inválidos se solicitado
         if filter_invalid:
@@ -421,22 +425,25 @@ class StratusSearchValidator:
         return hashlib.md5(content.encode()).hexdigest()
     
     def _generate_cache_key(self, result: SearchResult) -> str:
-        """Gera chave de cache para validação"""
-        content = f"{result.url}{result.title}{result.snippet}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Gera chave de cache para validação (URL + hash do conteúdo)"""
+        content = f"{result.url}\x00{result.title}\x00{result.snippet}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
     
     def _get_cached_validation(self, cache_key: str) -> Optional[ValidationResult]:
         """Recupera validação do cache"""
-        if cache_key in self.validation_cache:
-            cached_data = self.validation_cache[cache_key]
-            
+        cached_data = self.validation_cache.get(cache_key)
+        if cached_data is not None:
             # Verifica se não expirou
             if datetime.now() - cached_data['timestamp'] < self.config.cache_ttl:
+                self.validation_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                self._update_cache_hit_rate()
                 return cached_data['validation']
-            else:
-                # Remove entrada expirada
-                del self.validation_cache[cache_key]
+            # Remove entrada expirada
+            del self.validation_cache[cache_key]
         
+        self.cache_misses += 1
+        self._update_cache_hit_rate()
         return None
     
     def _cache_validation(self, cache_key: str, validation: ValidationResult):
@@ -445,15 +452,11 @@ class StratusSearchValidator:
             'validation': validation,
             'timestamp': datetime.now()
         }
+        self.validation_cache.move_to_end(cache_key)
         
-        # Limita tamanho do cache
-        if len(self.validation_cache) > 1000:
-            # Remove entradas mais antigas
-            oldest_key = min(
-                self.validation_cache.keys(),
-                key=lambda k: self.validation_cache[k]['timestamp']
-            )
-            del self.validation_cache[oldest_key]
+        # Limita tamanho do cache: remove a entrada menos usada recentemente
+        if len(self.validation_cache) > self.cache_max_size:
+            self.validation_cache.popitem(last=False)
     
     def _update_metrics(self, success: bool, execution_time: float, is_valid: bool):
         """Atualiza métricas do validador"""
@@ -478,12 +481,9 @@ class StratusSearchValidator:
         
         self.metrics.last_validation = datetime.now()
     
-    def _update_cache_hit_rate(self, cache_hit: bool) -> float:
-        """Atualiza taxa de cache hit"""
-        if cache_hit:
-            return min(self.metrics.cache_hit_rate + 0.01, 1.0)
-        else:
-            return max(self.metrics.cache_hit_rate - 0.01, 0.0)
+    def _update_cache_hit_rate(self):
+        """Atualiza taxa de cache hit a partir dos contadores do cache"""
+        self.metrics.cache_hit_rate = self.cache_hits / (self.cache_hits + self.cache_misses)
     
     def get_metrics(self) -> ValidationMetrics:
         """Retorna métricas atuais do validador"""
@@ -492,5 +492,8 @@ class StratusSearchValidator:
     def clear_cache(self):
         """Limpa o cache de validação"""
         self.validation_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.metrics.cache_hit_rate = 0.0
         self.content_hashes.clear()
         self.logger._log_info("Cache de validação limpo") 
\ No newline at end of file
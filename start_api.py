@@ -5,6 +5,7 @@ Script para iniciar a API Stratus.IA
 
 import uvicorn
 import os
+import sys
 from dotenv import load_dotenv
 
 # Carrega variáveis de ambiente
@@ -16,9 +17,12 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8000"))
     reload = os.getenv("DEBUG", "false").lower() == "true"
     
-    print(f"🚀 Iniciando Stratus.IA API em http://{host}:{port}")
-    print(f"📝 Debug mode: {reload}")
-    print(f"🌍 Ambiente: {os.getenv('ENVIRONMENT', 'development')}")
+    sys.stdout.write(
+        f"🚀 Iniciando Stratus.IA API em http://{host}:{port}\n"
+        f"📝 Debug mode: {reload}\n"
+        f"🌍 Ambiente: {os.getenv('ENVIRONMENT', 'development')}\n"
+    )
+    sys.stdout.flush()
     
     # Inicia o servidor
     uvicorn.run(